@@ -5,7 +5,7 @@ import logging
 
 import pytest
 
-from uhf_rfid.core.dispatcher import Dispatcher
+from uhf_rfid.core.dispatcher import Dispatcher, batch_notifications
 from uhf_rfid.core.exceptions import TimeoutError, CommandError
 from uhf_rfid.protocols import framing
 from uhf_rfid.protocols.cph import constants as cph_const
@@ -221,6 +221,107 @@ async def test_unregister_notification_callback(dispatcher: Dispatcher, mock_tra
     # Assert callback was NOT called
     assert not callback_called
 
+@pytest.mark.asyncio
+async def test_bulk_register_unregister_notification_callbacks(dispatcher: Dispatcher, mock_transport: MockTransport):
+    """Test registering/unregistering one callback for several codes at once."""
+    received_codes = []
+
+    async def notification_callback(ft, a, fc, p):
+        received_codes.append(fc)
+
+    await dispatcher.register_notification_callbacks((0x80, 0x81), notification_callback)
+
+    notif_tlv = tlv.build_tlv(cph_const.TAG_SINGLE_TAG, tlv.build_tlv(cph_const.TAG_EPC, b'TAG1'))
+    mock_transport.add_responses([
+        build_mock_notification(0x80, notif_tlv),
+        build_mock_notification(0x81, notif_tlv),
+    ])
+    await mock_transport.connect()
+    await asyncio.sleep(0.05)
+
+    assert received_codes == [0x80, 0x81]
+
+    await dispatcher.unregister_notification_callbacks((0x80, 0x81), notification_callback)
+
+    mock_transport.add_response(build_mock_notification(0x80, notif_tlv))
+    await asyncio.sleep(0.05)
+
+    # No further dispatch after the bulk unregister
+    assert received_codes == [0x80, 0x81]
+
+@pytest.mark.asyncio
+async def test_batch_notification_callback(dispatcher: Dispatcher, mock_transport: MockTransport):
+    """Test a batch-capable callback gets one call per drained run, in order."""
+    def notif_for(epc: bytes) -> bytes:
+        notif_tlv = tlv.build_tlv(cph_const.TAG_SINGLE_TAG, tlv.build_tlv(cph_const.TAG_EPC, epc))
+        return build_mock_notification(0x80, notif_tlv)
+
+    batch_calls = []
+
+    @batch_notifications
+    async def batch_callback(ft, a, fc, params_list):
+        batch_calls.append((ft, fc, params_list))
+
+    await dispatcher.register_notification_callback(0x80, batch_callback)
+
+    # Three same-code notifications arriving in one chunk form a single run
+    await dispatcher._data_received_handler(notif_for(b'TAG1') + notif_for(b'TAG2') + notif_for(b'TAG3'))
+
+    assert len(batch_calls) == 1
+    ft, fc, params_list = batch_calls[0]
+    assert ft == cph_const.FRAME_TYPE_NOTIFICATION
+    assert fc == 0x80
+    # The list preserves arrival order
+    epcs = [p[cph_const.TAG_SINGLE_TAG][cph_const.TAG_EPC] for p in params_list]
+    assert epcs == [b'TAG1'.hex().upper(), b'TAG2'.hex().upper(), b'TAG3'.hex().upper()]
+
+@pytest.mark.asyncio
+async def test_batch_notification_callback_single_frame(dispatcher: Dispatcher, mock_transport: MockTransport):
+    """Test a batch-capable callback gets a one-element list for a lone frame."""
+    notif_tlv = tlv.build_tlv(cph_const.TAG_SINGLE_TAG, tlv.build_tlv(cph_const.TAG_EPC, b'TAG1'))
+
+    batch_calls = []
+
+    @batch_notifications
+    async def batch_callback(ft, a, fc, params_list):
+        batch_calls.append(params_list)
+
+    await dispatcher.register_notification_callback(0x80, batch_callback)
+
+    # A single notification must still honour the list contract
+    await dispatcher._data_received_handler(build_mock_notification(0x80, notif_tlv))
+
+    assert len(batch_calls) == 1
+    params_list = batch_calls[0]
+    assert isinstance(params_list, list) and len(params_list) == 1
+    assert params_list[0][cph_const.TAG_SINGLE_TAG][cph_const.TAG_EPC] == b'TAG1'.hex().upper()
+
+@pytest.mark.asyncio
+async def test_batch_and_plain_notification_callbacks_coexist(dispatcher: Dispatcher, mock_transport: MockTransport):
+    """Test a batched run still delivers per-frame to unmarked callbacks."""
+    def notif_for(epc: bytes) -> bytes:
+        notif_tlv = tlv.build_tlv(cph_const.TAG_SINGLE_TAG, tlv.build_tlv(cph_const.TAG_EPC, epc))
+        return build_mock_notification(0x80, notif_tlv)
+
+    batch_calls = []
+    plain_calls = []
+
+    @batch_notifications
+    async def batch_callback(ft, a, fc, params_list):
+        batch_calls.append(params_list)
+
+    async def plain_callback(ft, a, fc, params):
+        plain_calls.append(params[cph_const.TAG_SINGLE_TAG][cph_const.TAG_EPC])
+
+    await dispatcher.register_notification_callback(0x80, batch_callback)
+    await dispatcher.register_notification_callback(0x80, plain_callback)
+
+    await dispatcher._data_received_handler(notif_for(b'TAG1') + notif_for(b'TAG2'))
+
+    # Marked callback: one call with the whole run; unmarked: one per frame
+    assert len(batch_calls) == 1 and len(batch_calls[0]) == 2
+    assert plain_calls == [b'TAG1'.hex().upper(), b'TAG2'.hex().upper()]
+
 @pytest.mark.asyncio
 async def test_buffer_processing_fragmented(dispatcher: Dispatcher, mock_transport: MockTransport):
     """Test processing a frame received in multiple fragments."""
@@ -84,7 +84,10 @@ class TestReaderCommands:
         self.mock_protocol.encode_lock_tag_request = MagicMock(return_value=b'') # Added
         self.mock_protocol.encode_kill_tag_request = MagicMock(return_value=b'') # Added
 
-        # --- Inventory --- 
+        # --- Misc ---
+        self.mock_protocol.encode_audio_play_request = MagicMock(return_value=b'') # Added
+
+        # --- Inventory ---
         self.mock_protocol.encode_start_inventory_request = MagicMock(return_value=b'') # Added
         self.mock_protocol.encode_stop_inventory_request = MagicMock(return_value=b'') # Added
         self.mock_protocol.encode_inventory_single_burst_request = MagicMock(return_value=b'') # Added
@@ -100,10 +103,10 @@ class TestReaderCommands:
         self.mock_dispatcher.send_command_wait_response = AsyncMock()
         self.mock_dispatcher.register_notification_callback = AsyncMock()
         self.mock_dispatcher.unregister_notification_callback = AsyncMock()
+        self.mock_dispatcher.register_notification_callbacks = AsyncMock()
+        self.mock_dispatcher.unregister_notification_callbacks = AsyncMock()
         self.mock_dispatcher.unregister_callback_from_all = AsyncMock()
 
-        self.reader.connect = AsyncMock()
-        self.reader.disconnect = AsyncMock()
 
     # def teardown_method(self, method):
     #     self.patcher.stop() # Remove if patcher is removed
@@ -117,14 +120,11 @@ class TestReaderCommands:
 
         await self.reader.register_tag_notify_callback(specific_tag_callback)
 
-        # Verify dispatcher mock was called correctly with CPH NOTIFICATION codes
-        self.mock_dispatcher.register_notification_callback.assert_any_call(
-            cph_const.NOTIF_TAG_UPLOADED, specific_tag_callback
-        )
-        self.mock_dispatcher.register_notification_callback.assert_any_call(
-            cph_const.NOTIF_OFFLINE_TAG_UPLOADED, specific_tag_callback
+        # Both CPH NOTIFICATION codes are registered in one bulk call
+        self.mock_dispatcher.register_notification_callbacks.assert_awaited_once_with(
+            (cph_const.NOTIF_TAG_UPLOADED, cph_const.NOTIF_OFFLINE_TAG_UPLOADED),
+            specific_tag_callback
         )
-        assert self.mock_dispatcher.register_notification_callback.call_count == 2
 
     # --- Test Refactored Commands --- 
 
@@ -208,11 +208,10 @@ class TestReaderCommands:
         power_to_set = 30
         encoded_set_params = b'\x26\x02\x01\x1e'
         self.mock_dispatcher.send_command_wait_response.return_value = {cph_const.TAG_STATUS: 0x00}
-        encode_args = {"power_dbm": power_to_set} # Define encode_args as dict
         self.mock_protocol.encode_set_power_request.return_value = encoded_set_params
         await self.reader.set_power(power_to_set, address=address)
-        # Expect call with keyword arguments
-        self.mock_protocol.encode_set_power_request.assert_called_once_with(**encode_args)
+        # The pre-bound setter path passes the single argument positionally
+        self.mock_protocol.encode_set_power_request.assert_called_once_with(power_to_set)
         self.mock_dispatcher.send_command_wait_response.assert_awaited_once_with(
             command_code=cph_const.CMD_SET_PARAMETER,
             address=address,
@@ -224,7 +223,6 @@ class TestReaderCommands:
         """Test set_buzzer delegates correctly."""
         address = 0x0000
         enabled = True
-        encode_args = {"enabled": enabled}
         encoded_params = b'dummy_set_buzzer_request'
         dummy_response_params = {cph_const.TAG_STATUS: 0x00}
 
@@ -233,8 +231,7 @@ class TestReaderCommands:
 
         await self.reader.set_buzzer(enabled=enabled, address=address)
 
-        # Expect call with keyword arguments
-        self.mock_protocol.encode_set_buzzer_request.assert_called_once_with(**encode_args)
+        self.mock_protocol.encode_set_buzzer_request.assert_called_once_with(enabled)
         self.mock_dispatcher.send_command_wait_response.assert_awaited_once_with(
             command_code=cph_const.CMD_SET_PARAMETER,
             address=address,
@@ -270,7 +267,6 @@ class TestReaderCommands:
         """Test set_filter_time delegates correctly."""
         address = 0x0000
         filter_time_ms = 150 # Example value
-        encode_args = {"filter_time_ms": filter_time_ms}
         encoded_params = b'dummy_set_filter_time_request'
         dummy_response_params = {cph_const.TAG_STATUS: 0x00}
 
@@ -279,8 +275,7 @@ class TestReaderCommands:
 
         await self.reader.set_filter_time(filter_time_ms=filter_time_ms, address=address)
 
-        # Expect call with keyword arguments
-        self.mock_protocol.encode_set_filter_time_request.assert_called_once_with(**encode_args)
+        self.mock_protocol.encode_set_filter_time_request.assert_called_once_with(filter_time_ms)
         self.mock_dispatcher.send_command_wait_response.assert_awaited_once_with(
             command_code=cph_const.CMD_SET_PARAMETER,
             address=address,
@@ -385,11 +380,12 @@ class TestReaderCommands:
         word_addr = 2
         word_count = 6
         access_password = "11223344"
+        # The Reader parses the hex password once; encoders receive bytes.
         encode_args = {
             "mem_bank": mem_bank,
             "word_addr": word_addr,
             "word_count": word_count,
-            "access_password": access_password,
+            "access_password": bytes.fromhex(access_password),
         }
         encoded_params = b'dummy_read_tag_request'
         dummy_response_params = {cph_const.TAG_EPC: b'\xaa\xbb\xcc\xdd\xee\xff'}
@@ -418,6 +414,33 @@ class TestReaderCommands:
         self.mock_protocol.decode_read_tag_response.assert_called_once_with(dummy_response_params)
         assert result == expected_data
 
+    @pytest.mark.asyncio
+    async def test_reader_read_tag_memory_batch_ordering_and_errors(self):
+        """Test batch reads keep spec order and surface failures per item."""
+        async def fake_read(reader, bank, word_ptr, word_count, access_password, address=0x0000):
+            # Scramble completion order so the test catches any pairing
+            # that depends on which read finishes first.
+            await asyncio.sleep(0.01 if bank == cph_const.MEM_BANK_TID else 0)
+            if bank == cph_const.MEM_BANK_USER:
+                raise CommandError(message="read failed")
+            return bytes([bank])
+
+        specs = [
+            (cph_const.MEM_BANK_TID, 0, 4, None),
+            (cph_const.MEM_BANK_USER, 0, 2, None),
+            (cph_const.MEM_BANK_EPC, 2, 6, None),
+        ]
+        # Reader defines __slots__, so patch the method on the class
+        with patch.object(Reader, 'read_tag_memory', fake_read):
+            results = await self.reader.read_tag_memory_batch(specs)
+
+        # Results come back in spec order, not completion order, and the
+        # failing read is captured in place instead of aborting the batch.
+        assert len(results) == 3
+        assert results[0] == bytes([cph_const.MEM_BANK_TID])
+        assert isinstance(results[1], CommandError)
+        assert results[2] == bytes([cph_const.MEM_BANK_EPC])
+
     @pytest.mark.asyncio
     async def test_reader_write_tag_success(self):
         """Test write_tag delegates correctly."""
@@ -430,7 +453,7 @@ class TestReaderCommands:
             "mem_bank": mem_bank,
             "word_addr": word_addr,
             "data": data,
-            "access_password": access_password,
+            "access_password": bytes.fromhex(access_password),
         }
         encoded_params = b'dummy_write_tag_request'
         dummy_response_params = {cph_const.TAG_STATUS: 0x00} # Expect only status OK
@@ -464,7 +487,7 @@ class TestReaderCommands:
         access_password = "FFFFFFFF"
         encode_args = {
             "lock_payload": lock_payload,
-            "access_password": access_password,
+            "access_password": bytes.fromhex(access_password),
         }
         encoded_params = b'dummy_lock_tag_request'
         dummy_response_params = {cph_const.TAG_STATUS: 0x00}
@@ -487,42 +510,100 @@ class TestReaderCommands:
         )
         # No decode_func for lock_tag
 
-    # @pytest.mark.asyncio
-    # async def test_reader_kill_tag_success(self):
-    #     """Test kill_tag delegates correctly."""
-    #     # Commented out because kill_tag needs refactoring in reader.py
-    #     address = 0x4444
-    #     kill_password = "12345678"
-    #     encode_args = {"kill_password": kill_password}
-    #     encoded_params = b'dummy_kill_tag_request'
-    #     dummy_response_params = {cph_const.TAG_STATUS: 0x00}
-    #
-    #     self.mock_protocol.encode_kill_tag_request.return_value = encoded_params
-    #     self.mock_dispatcher.send_command_wait_response.return_value = dummy_response_params
-    #
-    #     await self.reader.kill_tag(
-    #         kill_password=kill_password,
-    #         address=address,
-    #     )
-    #
-    #     self.mock_protocol.encode_kill_tag_request.assert_called_once_with(**encode_args)
-    #     self.mock_dispatcher.send_command_wait_response.assert_awaited_once_with(
-    #         command_code=cph_const.CMD_LOCK_TAG, # Should use CMD_LOCK_TAG after refactor
-    #         address=address,
-    #         params_data=encoded_params
-    #     )
-    #     # No decode_func for kill_tag
+    @pytest.mark.asyncio
+    async def test_reader_kill_tag_success(self):
+        """Test kill_tag delegates correctly."""
+        kill_password = "12345678"
+        # The Reader parses the hex password once; encoders receive bytes.
+        encode_args = {"kill_password": bytes.fromhex(kill_password)}
+        encoded_params = b'dummy_kill_tag_request'
+        dummy_response_params = {cph_const.TAG_STATUS: 0x00}
+
+        self.mock_protocol.encode_kill_tag_request.return_value = encoded_params
+        self.mock_dispatcher.send_command_wait_response.return_value = dummy_response_params
+
+        await self.reader.kill_tag(kill_password=kill_password)
+
+        # Expect call with keyword arguments
+        self.mock_protocol.encode_kill_tag_request.assert_called_once_with(**encode_args)
+        self.mock_dispatcher.send_command_wait_response.assert_awaited_once_with(
+            command_code=cph_const.CMD_LOCK_TAG, # Kill uses the Lock command code
+            address=0x0000,
+            params_data=encoded_params
+        )
+        # No decode_func for kill_tag
+
+    @pytest.mark.asyncio
+    async def test_reader_kill_tag_invalid_password(self):
+        """Test kill_tag rejects a malformed password before sending."""
+        with pytest.raises(ValueError):
+            await self.reader.kill_tag(kill_password="nothex")
+        self.mock_dispatcher.send_command_wait_response.assert_not_called()
+
+    # --- Audio ---
+    @pytest.mark.asyncio
+    async def test_reader_play_audio_bytes_success(self):
+        """Test play_audio_bytes passes the payload through untouched."""
+        address = 0x1234
+        payload = b'\x01\x02\x03\x04'
+        encoded_params = b'dummy_audio_play_request'
+        self.mock_protocol.encode_audio_play_request.return_value = encoded_params
+        self.mock_dispatcher.send_command_wait_response.return_value = {cph_const.TAG_STATUS: 0x00}
+
+        await self.reader.play_audio_bytes(payload, address=address)
+
+        # The pre-bound setter path passes the single argument positionally
+        self.mock_protocol.encode_audio_play_request.assert_called_once_with(payload)
+        self.mock_dispatcher.send_command_wait_response.assert_awaited_once_with(
+            command_code=cph_const.CMD_AUDIO_PLAY,
+            address=address,
+            params_data=encoded_params
+        )
+
+    @pytest.mark.asyncio
+    async def test_reader_play_audio_text_encodes(self):
+        """Test play_audio_text encodes the text before delegating."""
+        text = "Внимание"
+        encoding = 'utf-8'
+        self.mock_protocol.encode_audio_play_request.return_value = b'dummy_audio_play_request'
+        self.mock_dispatcher.send_command_wait_response.return_value = {cph_const.TAG_STATUS: 0x00}
+
+        await self.reader.play_audio_text(text, encoding=encoding)
+
+        self.mock_protocol.encode_audio_play_request.assert_called_once_with(text.encode(encoding))
+
+    @pytest.mark.asyncio
+    async def test_reader_play_audio_polymorphic(self):
+        """Test play_audio dispatches str and bytes inputs the same way."""
+        self.mock_protocol.encode_audio_play_request.return_value = b'dummy_audio_play_request'
+        self.mock_dispatcher.send_command_wait_response.return_value = {cph_const.TAG_STATUS: 0x00}
+
+        await self.reader.play_audio("hello")
+        await self.reader.play_audio(b'\xaa\xbb')
+
+        assert self.mock_protocol.encode_audio_play_request.call_args_list == [
+            ((b'hello',),),
+            ((b'\xaa\xbb',),),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reader_play_audio_empty_payload(self):
+        """Test an empty payload is rejected at encode time, before sending."""
+        # The CPH encoder raises ValueError on empty audio data; the Reader
+        # wraps encode failures into CommandError.
+        self.mock_protocol.encode_audio_play_request.side_effect = ValueError("Audio data cannot be empty")
+        with pytest.raises(CommandError, match="Failed to encode request.*"):
+            await self.reader.play_audio_bytes(b'')
+        self.mock_dispatcher.send_command_wait_response.assert_not_called()
 
     # --- Test Error Handling (Example: Protocol Encoding Error) ---
     @pytest.mark.asyncio
     async def test_reader_set_power_encode_error(self):
         power_to_set = 99
-        encode_args = {"power_dbm": power_to_set} # Define encode_args as dict
         self.mock_protocol.encode_set_power_request.side_effect = ProtocolError("Invalid power value")
         with pytest.raises(CommandError, match="Failed to encode request.*"):
             await self.reader.set_power(power_to_set)
-        # Expect call with keyword arguments
-        self.mock_protocol.encode_set_power_request.assert_called_once_with(**encode_args)
+        self.mock_protocol.encode_set_power_request.assert_called_once_with(power_to_set)
         self.mock_dispatcher.send_command_wait_response.assert_not_called()
 
     # --- Test Error Handling (Example: Protocol Decoding Error) ---
@@ -76,8 +76,7 @@ def test_encode_set_rtc_request_invalid_year():
 
 def test_encode_set_rtc_request_invalid_type():
     """Test encoding RTC with non-datetime object raises ProtocolError."""
-    # Updated match to expect the actual error message from the generic exception handler
-    with pytest.raises(ProtocolError, match="Unexpected error encoding RTC time: 'str' object has no attribute 'year'"):
+    with pytest.raises(ProtocolError, match="Invalid datetime object for CPH encoding: 'str' object has no attribute 'year'"):
         commands_device.encode_set_rtc_request("not a datetime") # type: ignore
 
 # --- Tests for Get RTC Response --- 
@@ -120,19 +119,19 @@ def test_decode_get_rtc_response_invalid_date_values():
     # Invalid Month (13)
     invalid_month_bytes = bytes([0x07, 0xE8, 13, 0x1D, 0x0A, 0x1E, 0x37])
     parsed_params_month = {cph_const.TAG_TIME: invalid_month_bytes}
-    with pytest.raises(ProtocolError, match="Error parsing RTC time data: Invalid date/time values"):
+    with pytest.raises(ProtocolError, match="Error parsing RTC time data"):
         commands_device.decode_get_rtc_response(parsed_params_month)
     
     # Invalid Day (32)
     invalid_day_bytes = bytes([0x07, 0xE8, 0x07, 32, 0x0A, 0x1E, 0x37])
     parsed_params_day = {cph_const.TAG_TIME: invalid_day_bytes}
-    with pytest.raises(ProtocolError, match="Error parsing RTC time data: Invalid date/time values"):
+    with pytest.raises(ProtocolError, match="Error parsing RTC time data"):
         commands_device.decode_get_rtc_response(parsed_params_day)
 
     # Invalid Hour (24)
     invalid_hour_bytes = bytes([0x07, 0xE8, 0x07, 0x1D, 24, 0x1E, 0x37])
     parsed_params_hour = {cph_const.TAG_TIME: invalid_hour_bytes}
-    with pytest.raises(ProtocolError, match="Error parsing RTC time data: Invalid date/time values"):
+    with pytest.raises(ProtocolError, match="Error parsing RTC time data"):
         commands_device.decode_get_rtc_response(parsed_params_hour)
 
     # Add similar checks for minute (60) and second (60) if desired 
\ No newline at end of file
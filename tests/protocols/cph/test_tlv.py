@@ -222,6 +222,16 @@ def test_build_tlv_value_too_long():
      with pytest.raises(ValueError, match="exceeds 255 bytes"):
           tlv.build_tlv(0x01, b'\x00' * 256)
 
+def test_build_tlvs_matches_joined_build_tlv():
+     items = [(cph_const.TAG_STATUS, b'\x00'), (cph_const.TAG_SOFTWARE_VERSION, b'\x04\x00\x01')]
+     expected = b''.join(tlv.build_tlv(t, v) for t, v in items)
+     assert tlv.build_tlvs(items) == expected
+     assert tlv.build_tlvs([]) == b''
+
+def test_build_tlvs_value_too_long():
+     with pytest.raises(ValueError, match="exceeds 255 bytes"):
+          tlv.build_tlvs([(0x01, b'\x00' * 256)])
+
 # 4. Test Specific Parameter TLV Builders - Corrected
 def build_power_parameter_tlv(power_dbm: int) -> bytes:
     """Builds the TLV to set reader power (1 byte value, 0-30 dBm)."""
@@ -1,26 +1,36 @@
 """UHF RFID Library - Asynchronous library for interacting with UHF RFID readers."""
 
-from .core import (
-    Reader,
-    ConnectionStatus,
-    UhfRfidError,
-    CommandError,
-    ProtocolError,
-    TransportError,
-    InvalidTagDataError,
-    UnknownTagError
-)
-from .transport import (
-    SerialTransport,
-    TcpTransport,
-    MockTransport,
-    UdpTransport
-)
-from .protocols.cph import CPHProtocol
-from .protocols.registry import get_installed_protocols, list_protocols
+import importlib
 
 __version__ = '0.2.0'
 
+# PEP 562 lazy imports: map public names to the submodule that provides them.
+# Submodules are only imported when the attribute is first accessed, so e.g.
+# `from uhf_rfid import MockTransport` does not pay for pyserial or the
+# protocol machinery.
+_LAZY = {
+    # Core components
+    'Reader': '.core',
+    'ConnectionStatus': '.core.status',
+    # Exceptions
+    'UhfRfidError': '.core.exceptions',
+    'CommandError': '.core.exceptions',
+    'ProtocolError': '.core.exceptions',
+    'TransportError': '.core.exceptions',
+    'InvalidTagDataError': '.core.exceptions',
+    'UnknownTagError': '.core.exceptions',
+    # Transport
+    'SerialTransport': '.transport',
+    'TcpTransport': '.transport',
+    'MockTransport': '.transport',
+    'UdpTransport': '.transport',
+    # Protocols
+    'CPHProtocol': '.protocols.cph',
+    # Protocol Registry
+    'get_installed_protocols': '.protocols.registry',
+    'list_protocols': '.protocols.registry',
+}
+
 __all__ = [
     # Core components
     'Reader',
@@ -42,4 +52,20 @@ __all__ = [
     # Protocol Registry
     'get_installed_protocols',
     'list_protocols',
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Load public attributes lazily on first access (PEP 562)."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so __getattr__ runs only once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
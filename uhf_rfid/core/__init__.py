@@ -1,15 +1,20 @@
 """Core components of the UHF RFID library."""
 
-from .reader import Reader
-from .status import ConnectionStatus
-from .exceptions import (
-    UhfRfidError,
-    CommandError,
-    ProtocolError,
-    TransportError,
-    InvalidTagDataError,
-    UnknownTagError
-)
+import importlib
+
+# Loaded lazily (PEP 562): importing exception types or ConnectionStatus
+# must not pull in .reader (which drags in asyncio plumbing, transports and
+# the protocol machinery).
+_LAZY = {
+    'Reader': '.reader',
+    'ConnectionStatus': '.status',
+    'UhfRfidError': '.exceptions',
+    'CommandError': '.exceptions',
+    'ProtocolError': '.exceptions',
+    'TransportError': '.exceptions',
+    'InvalidTagDataError': '.exceptions',
+    'UnknownTagError': '.exceptions',
+}
 
 __all__ = [
     'Reader',
@@ -19,5 +24,16 @@ __all__ = [
     'ProtocolError',
     'TransportError',
     'InvalidTagDataError',
-    'UnknownTagError'
-] 
\ No newline at end of file
+    'UnknownTagError',
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -2,8 +2,8 @@
 
 import asyncio
 import logging
-from typing import Optional, Callable, Any, Dict, Tuple, Coroutine, List
-from collections import deque, defaultdict
+from collections import deque
+from typing import Optional, Callable, Any, Dict, Tuple, Coroutine, List, Sequence
 
 from uhf_rfid.transport.base import BaseTransport, AsyncDataCallback
 from uhf_rfid.protocols.base_protocol import BaseProtocol
@@ -18,8 +18,111 @@ NotificationCallback = Callable[[int, int, int, Any], Coroutine[Any, Any, None]]
 
 DEFAULT_RESPONSE_TIMEOUT = 2.0 # Seconds to wait for a command response
 
+# Consumed-bytes threshold above which the rx buffer is compacted mid-drain.
+RX_COMPACT_THRESHOLD = 4096
+
+# Module-local bindings of the frame-type constants: the routing comparison
+# in the per-frame drain loop becomes a LOAD_GLOBAL instead of an attribute
+# lookup into cph_const.
+_FT_RESPONSE = cph_const.FRAME_TYPE_RESPONSE
+_FT_NOTIFICATION = cph_const.FRAME_TYPE_NOTIFICATION
+_FT_COMMAND = cph_const.FRAME_TYPE_COMMAND
+
+# Status TLV tag, bound once for the per-response status extraction.
+_STATUS_TLV_TAG = cph_const.TAG_STATUS
+
+
+def batch_notifications(callback: NotificationCallback) -> NotificationCallback:
+    """Marks an async notification callback as batch-capable.
+
+    A marked callback registered via register_notification_callback is
+    invoked once per drained burst of consecutive same-code notifications,
+    receiving a list of parsed parameter sets as its last argument instead
+    of a single one — one call per dozens of EPCs in a dense inventory
+    stream. A lone notification arrives as a one-element list, so the
+    callback never has to type-check its argument. Unmarked callbacks keep
+    per-frame delivery.
+    """
+    callback._uhf_rfid_batch = True  # type: ignore[attr-defined]
+    return callback
+
 logger = logging.getLogger(__name__) # Use logging
 
+
+class _Hex:
+    """Lazy hex formatter for log arguments.
+
+    Used with %s-style logging so the hex encoding runs only if a handler
+    actually renders the record — log filters and disabled levels skip the
+    cost entirely.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __str__(self):
+        return self._data.hex(' ').upper()
+
+
+class _RxBuffer:
+    """Receive-side byte store with O(1) amortized consumption.
+
+    A deliberate simplification of a circular buffer: the CPH frame
+    scanner relies on bytes.find/struct.unpack_from over a contiguous
+    region, so wrap-around segments would force a linearizing copy on
+    every scan. Instead the store stays contiguous and recycles space by
+    tracking a head offset; the consumed prefix is physically discarded
+    only when the buffer empties (O(1) clear) or the prefix grows past
+    the compact threshold, in which case only the short unconsumed tail
+    (at most one partial frame in steady state) is moved.
+    """
+
+    __slots__ = ('_data', '_head', '_compact_threshold')
+
+    def __init__(self, compact_threshold: int = RX_COMPACT_THRESHOLD):
+        self._data = bytearray()
+        self._head = 0
+        self._compact_threshold = compact_threshold
+
+    def __len__(self) -> int:
+        return len(self._data) - self._head
+
+    @property
+    def data(self) -> bytearray:
+        """Backing store; scan it starting at 'head'."""
+        return self._data
+
+    @property
+    def head(self) -> int:
+        """Backing-store index of the first unconsumed byte."""
+        return self._head
+
+    def extend(self, data: bytes) -> None:
+        """Appends newly received bytes at the tail."""
+        self._data.extend(data)
+
+    def consume_to(self, offset: int) -> None:
+        """Marks everything before 'offset' (a backing-store index) consumed."""
+        if not offset:
+            return
+        if offset >= len(self._data):
+            self._data.clear()
+            self._head = 0
+        elif offset > self._compact_threshold:
+            del self._data[:offset]
+            self._head = 0
+        else:
+            # Small consumed prefix: cheaper to keep and let the next
+            # drain resume from the stored head.
+            self._head = offset
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._head = 0
+
+
 class Dispatcher:
     """
     Handles incoming data, parses frames, matches responses to commands,
@@ -31,79 +134,234 @@ class Dispatcher:
         self._protocol = protocol
         self._response_timeout = response_timeout
 
-        self._rx_buffer = bytearray()
+        self._rx_buffer = _RxBuffer()
         self._transport.register_data_callback(self._data_received_handler) # Register to get data
 
         # For matching responses to commands
         # Key: command_code (or maybe a unique transaction ID)
         # Value: asyncio.Future that the waiting command coroutine 'awaits'
+        # No lock: the event loop is single-threaded and every access below
+        # is a single atomic dict operation with no await inside, so a Lock
+        # would only add scheduler round-trips.
+        # The CPH response carries no host-chosen transaction ID — it only
+        # echoes the command code — so commands sharing a code are matched
+        # FIFO: the head waiter sits in _pending_responses and later ones
+        # queue in _pending_overflow until the head is resolved.
         self._pending_responses: Dict[int, asyncio.Future] = {}
-        self._response_lock = asyncio.Lock() # Protect access to _pending_responses
+        self._pending_overflow: Dict[int, deque] = {}
 
         # For notification callbacks (e.g., tag reads)
-        # CHANGE: Use a dictionary mapping frame_code to a list of callbacks
-        self._notification_callbacks: Dict[int, List[NotificationCallback]] = defaultdict(list)
-        self._callback_lock = asyncio.Lock() # Protect access to callbacks dict
+        # Copy-on-write: each frame_code maps to an immutable tuple of
+        # callbacks. Readers snapshot the tuple with one dict lookup and no
+        # copy; writers (rare) replace the whole tuple under _callback_lock.
+        self._notification_callbacks: Dict[int, Tuple[NotificationCallback, ...]] = {}
+        # Reverse index: which frame codes each callback is registered for.
+        # Lets unregister_callback_from_all touch only the relevant codes
+        # instead of scanning every registered tuple.
+        self._callback_codes: Dict[NotificationCallback, set] = {}
+        self._callback_lock = asyncio.Lock() # Serializes registry writers
+
+        # Routing table for the drain loop: one dict lookup per frame
+        # instead of an if/elif chain of comparisons. All handlers share
+        # the (address, frame_code, parsed_params, raw_params) signature.
+        self._frame_handlers = {
+            _FT_RESPONSE: self._handle_response,
+            _FT_NOTIFICATION: self._handle_notification,
+            _FT_COMMAND: self._handle_unexpected_command,
+        }
 
     async def _data_received_handler(self, data: bytes) -> None:
         """Async callback called by the transport layer when data arrives."""
-        logger.debug(f"Received {len(data)} bytes: {data.hex(' ').upper()}")
-        self._rx_buffer.extend(data)
-        await self._process_buffer()
+        logger.debug("Received %d bytes: %s", len(data), _Hex(data))
+        rx = self._rx_buffer
+        if len(rx) == 0:
+            # Steady-state fast path: the store is empty, so the chunk the
+            # transport handed us is scanned in place and only an
+            # unconsumed tail (a partial frame) is buffered. This removes
+            # the second full copy of every received byte.
+            frames, consumed = self._scan_buffer(data, 0)
+            if consumed < len(data):
+                rx.extend(memoryview(data)[consumed:])
+            if frames:
+                await self._dispatch_frames(frames)
+        else:
+            rx.extend(data)
+            await self._process_buffer()
 
     async def _process_buffer(self) -> None:
-        """Continuously tries to parse complete frames from the buffer."""
+        """Drains complete frames from the buffer and dispatches them.
+
+        Split in two passes so a burst of frames is scanned and compacted
+        within a single event-loop step: _scan_frames is fully synchronous
+        (no awaits to fragment the drain across loop iterations), and only
+        the dispatch of the collected frames awaits handlers.
+        """
+        frames = self._scan_frames()
+        if frames:
+            await self._dispatch_frames(frames)
+
+    def _scan_frames(self) -> List[Tuple[int, int, int, bytes, int]]:
+        """Drains all complete, consumable frames from the rx store.
+
+        Consumed bytes are tracked by offset and handed back to the store
+        in one call at the end, so a burst of N frames costs O(N) memmove
+        traffic instead of O(N^2).
+        """
+        rx = self._rx_buffer
+        frames, offset = self._scan_buffer(rx.data, rx.head)
+        rx.consume_to(offset)
+        return frames
+
+    def _scan_buffer(self, buffer, offset: int) -> Tuple[List[Tuple[int, int, int, bytes, int]], int]:
+        """Synchronously extracts complete frames from a contiguous buffer.
+
+        Works on any bytes-like object (the rx store's backing bytearray,
+        or a transport chunk scanned in place); returns the scanned frames
+        and the offset of the first unconsumed byte. Frames whose
+        destination does not exist (no registered callback / no pending
+        command) are dropped here without the parameter copy or any TLV
+        parsing.
+        """
+        frames: List[Tuple[int, int, int, bytes, int]] = []
+        # Checked once per drain: the hex dumps below are built eagerly by
+        # the f-strings, which would dominate the loop at INFO level.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         while True:
-            parsed_frame_data = framing.find_and_parse_frame(self._rx_buffer)
+            prev_offset = offset
+            parsed_frame_data, offset = framing.find_and_parse_frame_at(buffer, offset)
 
             if parsed_frame_data is None:
+                if offset != prev_offset:
+                    # A corrupt frame was skipped; keep scanning from the
+                    # advanced offset for a following good frame.
+                    continue
                 # No complete, valid frame found in the buffer currently.
                 # Wait for more data (handled by subsequent calls to _data_received_handler)
                 # Log if buffer gets excessively large?
-                if len(self._rx_buffer) > 4096: # Example threshold
-                     logger.warning(f"Receive buffer size exceeds {len(self._rx_buffer)} bytes. Potential sync issue or large data.")
+                if len(buffer) - offset > 4096: # Example threshold
+                     logger.warning(f"Receive buffer size exceeds {len(buffer) - offset} bytes. Potential sync issue or large data.")
                 break # Exit the loop for now
 
             # A valid frame was found and buffer was consumed
             frame_type, address, frame_code, params_data, frame_len = parsed_frame_data
-            logger.debug(f"Parsed frame: Type=0x{frame_type:02X}, Addr=0x{address:04X}, Code=0x{frame_code:02X}, Len={frame_len}, Params={params_data.hex(' ').upper()}")
 
+            # Check the destination before paying for the parameter copy
+            # and TLV parsing: frames nobody will consume are dropped here
+            # with zero parsing work. The parameter view must be released
+            # on the drop paths, or compaction below would hit BufferError.
+            if frame_type == _FT_NOTIFICATION and frame_code not in self._notification_callbacks:
+                params_data.release()
+                if debug_enabled:
+                    logger.debug(f"Dropping notification 0x{frame_code:02X}: no callbacks registered")
+                continue
+            if frame_type == _FT_RESPONSE and frame_code not in self._pending_responses:
+                params_data.release()
+                logger.warning(f"Received unexpected or late response for command 0x{frame_code:02X}")
+                continue
+
+            # Promote the zero-copy parameter view to owned bytes here, at
+            # the single point where frame data escapes the scan loop.
+            # Handlers and user callbacks may retain it (or slices of it)
+            # indefinitely, so it must not alias the live rx buffer, which
+            # is compacted below and extended on the next receive.
+            params_data = bytes(params_data)
+            if debug_enabled:
+                logger.debug("Parsed frame: Type=0x%02X, Addr=0x%04X, Code=0x%02X, Len=%d, Params=%s",
+                             frame_type, address, frame_code, frame_len, _Hex(params_data))
+            frames.append((frame_type, address, frame_code, params_data, frame_len))
+
+            # Loop again immediately to check if another complete frame exists in the buffer
+
+        return frames, offset
+
+    async def _dispatch_frames(self, frames: List[Tuple[int, int, int, bytes, int]]) -> None:
+        """Parses parameters and awaits the handler for each scanned frame.
+
+        Runs of consecutive notifications sharing a code and address are
+        collapsed into one batch delivery (see batch_notifications); all
+        other frames keep per-frame dispatch.
+        """
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        parsed_frames: List[Tuple[int, int, int, Any, bytes]] = []
+        for frame_type, address, frame_code, params_data, frame_len in frames:
             try:
                 # Now parse the parameters using the protocol logic
                 parsed_params = self._protocol.parse_parameters(frame_code, frame_type, params_data)
-                logger.debug(f"Parsed params: {parsed_params}")
-
-                # Route the frame based on its type
-                if frame_type == cph_const.FRAME_TYPE_RESPONSE:
-                    await self._handle_response(address, frame_code, parsed_params, params_data) # Pass raw params too for CommandError
-                elif frame_type == cph_const.FRAME_TYPE_NOTIFICATION:
-                    await self._handle_notification(address, frame_code, parsed_params)
-                elif frame_type == cph_const.FRAME_TYPE_COMMAND:
-                    # Typically, a host doesn't receive commands, but log if it happens
-                    logger.warning(f"Received unexpected COMMAND frame: Addr=0x{address:04X}, Code=0x{frame_code:02X}")
-                else:
-                    logger.warning(f"Received unknown frame type: 0x{frame_type:02X}")
-
+                if debug_enabled:
+                    logger.debug(f"Parsed params: {parsed_params}")
             except (ProtocolError, ChecksumError, FrameParseError) as e:
                 # Error during parameter parsing specifically
                 logger.error(f"Error parsing parameters for frame (Type=0x{frame_type:02X}, Code=0x{frame_code:02X}): {e}")
                 # Decide how to handle - maybe notify an error callback?
+                continue
+            except Exception as e:
+                logger.exception(f"Unexpected error parsing frame parameters: {e}") # Log stack trace
+                continue
+            parsed_frames.append((frame_type, address, frame_code, parsed_params, params_data))
+
+        i = 0
+        n = len(parsed_frames)
+        while i < n:
+            frame_type, address, frame_code, parsed_params, params_data = parsed_frames[i]
+            if frame_type == _FT_NOTIFICATION:
+                # Collapse the run of same-code/same-address notifications
+                # starting here into a single batch delivery.
+                j = i + 1
+                while (j < n and parsed_frames[j][0] == _FT_NOTIFICATION
+                        and parsed_frames[j][2] == frame_code
+                        and parsed_frames[j][1] == address):
+                    j += 1
+                if j - i > 1:
+                    batch = [entry[3] for entry in parsed_frames[i:j]]
+                    await self._handle_notification_batch(address, frame_code, batch)
+                    i = j
+                    continue
+            try:
+                # Route the frame based on its type
+                handler = self._frame_handlers.get(frame_type)
+                if handler is not None:
+                    await handler(address, frame_code, parsed_params, params_data)
+                else:
+                    logger.warning(f"Received unknown frame type: 0x{frame_type:02X}")
             except Exception as e:
                  logger.exception(f"Unexpected error processing parsed frame: {e}") # Log stack trace
+            i += 1
 
-            # Loop again immediately to check if another complete frame exists in the buffer
+    async def _handle_notification_batch(self, address: int, frame_code: int, parsed_params_list: List[Any]) -> None:
+        """Delivers a drained run of same-code notifications to callbacks.
+
+        Batch-capable callbacks (marked with batch_notifications) get the
+        whole list in one call; the rest are called once per element, so
+        the per-frame contract is unchanged for existing callbacks.
+        """
+        for cb in self._notification_callbacks.get(frame_code, ()):
+            if getattr(cb, '_uhf_rfid_batch', False):
+                try:
+                    await cb(_FT_NOTIFICATION, address, frame_code, parsed_params_list)
+                except Exception as e:
+                    cb_name = getattr(cb, '__name__', repr(cb))
+                    logger.error(f"Error executing batch notification callback {cb_name} for code 0x{frame_code:02X}: {e}", exc_info=True)
+            else:
+                for parsed_params in parsed_params_list:
+                    try:
+                        await cb(_FT_NOTIFICATION, address, frame_code, parsed_params)
+                    except Exception as e:
+                        cb_name = getattr(cb, '__name__', repr(cb))
+                        logger.error(f"Error executing notification callback {cb_name} for code 0x{frame_code:02X}: {e}", exc_info=True)
 
     async def _handle_response(self, address: int, frame_code: int, parsed_params: Any, raw_params: bytes) -> None:
         """Handles a received response frame."""
-        future = None
-        async with self._response_lock:
-            future = self._pending_responses.pop(frame_code, None)
+        future = self._pending_responses.pop(frame_code, None)
+        if future is not None:
+            self._promote_next_waiter(frame_code)
 
         if future and not future.done():
-             # Check for error status in the response (assuming Status TLV is tag 0x07)
+             # Check for error status in the response. One .get collapses
+             # the former membership test plus lookup into a single hash
+             # probe of the Status TLV tag.
              status_code = None
-             if isinstance(parsed_params, dict) and 0x07 in parsed_params:
-                 status_data = parsed_params[0x07]
+             if isinstance(parsed_params, dict):
+                 status_data = parsed_params.get(_STATUS_TLV_TAG)
                  # Check if it's the parsed status code directly or needs extraction
                  if isinstance(status_data, int):
                      status_code = status_data
@@ -116,31 +374,83 @@ class Dispatcher:
                  future.set_exception(error)
              else:
                  # Success or no status code found (assume success?)
-                 logger.debug(f"Response received for command 0x{frame_code:02X}")
+                 if logger.isEnabledFor(logging.DEBUG):
+                     logger.debug(f"Response received for command 0x{frame_code:02X}")
                  future.set_result(parsed_params) # Resolve the future with parsed data
         else:
             # No pending future found for this response code, or future already done (e.g., timed out)
             logger.warning(f"Received unexpected or late response for command 0x{frame_code:02X}: {parsed_params}")
             # Optionally, could route unexpected responses to a separate callback
 
-    async def _handle_notification(self, address: int, frame_code: int, parsed_params: Any) -> None:
-        """Handles a received notification frame by invoking callbacks."""
+    def _promote_next_waiter(self, command_code: int) -> None:
+        """Moves the next queued same-code waiter (if any) to the head slot."""
+        overflow = self._pending_overflow.get(command_code)
+        if overflow:
+            self._pending_responses[command_code] = overflow.popleft()
+            if not overflow:
+                del self._pending_overflow[command_code]
+
+    def _discard_waiter(self, command_code: int, future: asyncio.Future) -> None:
+        """Removes a waiter from the pending structures, wherever it sits."""
+        if self._pending_responses.get(command_code) is future:
+            del self._pending_responses[command_code]
+            self._promote_next_waiter(command_code)
+            return
+        overflow = self._pending_overflow.get(command_code)
+        if overflow:
+            try:
+                overflow.remove(future)
+            except ValueError:
+                pass
+            if not overflow:
+                del self._pending_overflow[command_code]
+
+    async def _handle_unexpected_command(self, address: int, frame_code: int, parsed_params: Any, raw_params: bytes) -> None:
+        """Logs a COMMAND frame; a host normally never receives one."""
+        logger.warning(f"Received unexpected COMMAND frame: Addr=0x{address:04X}, Code=0x{frame_code:02X}")
+
+    async def _handle_notification(self, address: int, frame_code: int, parsed_params: Any, raw_params: bytes = b'') -> None:
+        """Handles a received notification frame by invoking callbacks.
+
+        'raw_params' is unused; it is accepted for the uniform handler
+        signature used by the routing table.
+        """
         #logger.info(f"Notification received: Addr=0x{address:04X}, Code=0x{frame_code:02X}, Params={parsed_params}")
-        callbacks_to_run: List[NotificationCallback] = []
-        async with self._callback_lock:
-            # Get the list of callbacks registered specifically for this frame_code
-            if frame_code in self._notification_callbacks:
-                callbacks_to_run = list(self._notification_callbacks[frame_code]) # Create a copy to run outside the lock
-            else:
-                 logger.debug(f"No callbacks registered for notification code 0x{frame_code:02X}")
-
-        if callbacks_to_run:
-             logger.debug(f"Invoking {len(callbacks_to_run)} callbacks for notification 0x{frame_code:02X}")
-             # Create tasks for all registered callbacks concurrently
-             tasks = [
-                 asyncio.create_task(cb(cph_const.FRAME_TYPE_NOTIFICATION, address, frame_code, parsed_params))
-                 for cb in callbacks_to_run
-             ]
+        # Lock-free read: the tuple is immutable, so the single dict lookup
+        # is a complete, stable snapshot — no lock and no copy needed even
+        # while callbacks run below.
+        callbacks_to_run = self._notification_callbacks.get(frame_code, ())
+        if not callbacks_to_run:
+            logger.debug(f"No callbacks registered for notification code 0x{frame_code:02X}")
+
+        if len(callbacks_to_run) == 1:
+             # Fast path for the common single-listener configuration:
+             # awaiting the coroutine directly skips the Task object, the
+             # gather wrapper and a scheduler round-trip per notification.
+             cb = callbacks_to_run[0]
+             try:
+                 if getattr(cb, '_uhf_rfid_batch', False):
+                     # Batch-marked callbacks always receive a list (see
+                     # batch_notifications), even for a lone notification.
+                     await cb(_FT_NOTIFICATION, address, frame_code, [parsed_params])
+                 else:
+                     await cb(_FT_NOTIFICATION, address, frame_code, parsed_params)
+             except Exception as e:
+                 cb_name = getattr(cb, '__name__', repr(cb))
+                 logger.error(f"Error executing notification callback {cb_name} for code 0x{frame_code:02X}: {e}", exc_info=True)
+        elif callbacks_to_run:
+             n = len(callbacks_to_run)
+             logger.debug(f"Invoking {n} callbacks for notification 0x{frame_code:02X}")
+             # Create tasks for all registered callbacks concurrently,
+             # filling a presized list so the fan-out does no list growth.
+             tasks: List[Optional[asyncio.Task]] = [None] * n
+             for i in range(n):
+                 cb = callbacks_to_run[i]
+                 # Same list contract as the single-listener path above.
+                 params_arg = [parsed_params] if getattr(cb, '_uhf_rfid_batch', False) else parsed_params
+                 tasks[i] = asyncio.create_task(
+                     cb(_FT_NOTIFICATION, address, frame_code, params_arg)
+                 )
              # Wait for all callback tasks to complete (or handle errors)
              # Use return_exceptions=True to log errors but not stop others
              results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -171,40 +481,44 @@ class Dispatcher:
         if not self._transport.is_connected():
             raise TransportError("Cannot send command: Not connected.")
 
-        future = asyncio.Future()
-        async with self._response_lock:
-            if command_code in self._pending_responses:
-                # This shouldn't happen if commands are sent sequentially and awaited
-                logger.error(f"Command collision: Already waiting for response to code 0x{command_code:02X}")
-                # Handle this? Maybe raise an error or cancel previous?
-                # For now, let's overwrite, assuming the previous one timed out or was lost.
-                # A better approach might involve unique transaction IDs.
-                old_future = self._pending_responses[command_code]
-                if not old_future.done():
-                    old_future.set_exception(TimeoutError(f"Superseded by new command 0x{command_code:02X}"))
-
+        # loop.create_future() is the cheap construction path: it skips the
+        # get_event_loop() fallback inside asyncio.Future() and lets event
+        # loop implementations supply their own future type. A plain Future
+        # is already the minimal waiter here — asyncio.Event.wait() would
+        # allocate an internal Future per waiter on top of the Event.
+        future = asyncio.get_running_loop().create_future()
+        # Synchronous check-and-set; no await between the check and the
+        # store, so no other task can interleave.
+        if command_code not in self._pending_responses:
             self._pending_responses[command_code] = future
+        else:
+            # A command with the same code is already in flight. Queue FIFO
+            # behind it instead of superseding: the link delivers responses
+            # in order, so arrival order pairs waiters with responses.
+            logger.debug(f"Pipelining command 0x{command_code:02X} behind an in-flight command with the same code")
+            self._pending_overflow.setdefault(command_code, deque()).append(future)
 
         try:
             # Encode the command
             full_frame = self._protocol.encode_command(command_code, address, params_data)
-            logger.debug(f"Sending command: Code=0x{command_code:02X}, Addr=0x{address:04X}, Frame={full_frame.hex(' ').upper()}")
+            logger.debug("Sending command: Code=0x%02X, Addr=0x%04X, Frame=%s",
+                         command_code, address, _Hex(full_frame))
 
             # Send the command
             await self._transport.send(full_frame)
 
             # Wait for the response future to be resolved or timeout
-            logger.debug(f"Waiting for response to command 0x{command_code:02X} (timeout={self._response_timeout}s)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Waiting for response to command 0x{command_code:02X} (timeout={self._response_timeout}s)")
             response_data = await asyncio.wait_for(future, timeout=self._response_timeout)
-            logger.debug(f"Response received successfully for 0x{command_code:02X}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response received successfully for 0x{command_code:02X}")
             return response_data
 
         except asyncio.TimeoutError:
             logger.error(f"Timeout waiting for response to command 0x{command_code:02X}")
             # Clean up the future from pending requests if it's still there
-            async with self._response_lock:
-                if command_code in self._pending_responses and self._pending_responses[command_code] is future:
-                    del self._pending_responses[command_code]
+            self._discard_waiter(command_code, future)
             # Ensure future is cancelled if not already resolved/excepted
             if not future.done():
                  future.cancel("Timeout") # Set future to cancelled state
@@ -213,17 +527,13 @@ class Dispatcher:
              # Catch library-specific errors (Transport, Protocol, CommandError set by _handle_response)
              logger.error(f"Error during command 0x{command_code:02X}: {e}")
              # Clean up future if it wasn't resolved/excepted properly
-             async with self._response_lock:
-                 if command_code in self._pending_responses and self._pending_responses[command_code] is future:
-                     del self._pending_responses[command_code]
+             self._discard_waiter(command_code, future)
              if not future.done(): future.cancel(str(e))
              raise # Re-raise the caught exception
         except Exception as e:
              # Catch unexpected errors
              logger.exception(f"Unexpected error sending/waiting for command 0x{command_code:02X}: {e}")
-             async with self._response_lock:
-                 if command_code in self._pending_responses and self._pending_responses[command_code] is future:
-                     del self._pending_responses[command_code]
+             self._discard_waiter(command_code, future)
              if not future.done(): future.cancel(str(e))
              raise UhfRfidError(f"Unexpected error during command 0x{command_code:02X}: {e}") from e
 
@@ -233,25 +543,69 @@ class Dispatcher:
         if not asyncio.iscoroutinefunction(callback):
             raise TypeError("Notification callback must be an async function (defined with 'async def')")
         async with self._callback_lock:
-            # Add callback to the list for the specific frame_code
-            # Using defaultdict avoids checking if key exists
-            if callback not in self._notification_callbacks[frame_code]:
-                self._notification_callbacks[frame_code].append(callback)
+            # Copy-on-write: publish a new tuple instead of mutating in
+            # place so concurrent readers keep a consistent snapshot.
+            current = self._notification_callbacks.get(frame_code, ())
+            if callback not in current:
+                self._notification_callbacks[frame_code] = current + (callback,)
+                self._callback_codes.setdefault(callback, set()).add(frame_code)
                 logger.info(f"Registered callback {getattr(callback, '__name__', repr(callback))} for notification code 0x{frame_code:02X}")
             else:
                  logger.warning(f"Callback {getattr(callback, '__name__', repr(callback))} already registered for code 0x{frame_code:02X}")
 
+    async def register_notification_callbacks(self, frame_codes: Sequence[int], callback: NotificationCallback) -> None:
+        """Registers one async callback for several frame codes in a single critical section."""
+        if not asyncio.iscoroutinefunction(callback):
+            raise TypeError("Notification callback must be an async function (defined with 'async def')")
+        async with self._callback_lock:
+            for frame_code in frame_codes:
+                current = self._notification_callbacks.get(frame_code, ())
+                if callback not in current:
+                    self._notification_callbacks[frame_code] = current + (callback,)
+                    self._callback_codes.setdefault(callback, set()).add(frame_code)
+                    logger.info(f"Registered callback {getattr(callback, '__name__', repr(callback))} for notification code 0x{frame_code:02X}")
+                else:
+                    logger.warning(f"Callback {getattr(callback, '__name__', repr(callback))} already registered for code 0x{frame_code:02X}")
+
+    async def unregister_notification_callbacks(self, frame_codes: Sequence[int], callback: NotificationCallback) -> None:
+        """Unregisters a callback from several frame codes in a single critical section."""
+        async with self._callback_lock:
+            for frame_code in frame_codes:
+                current = self._notification_callbacks.get(frame_code, ())
+                if callback in current:
+                    remaining = tuple(cb for cb in current if cb != callback)
+                    if remaining:
+                        self._notification_callbacks[frame_code] = remaining
+                    else:
+                        del self._notification_callbacks[frame_code]
+                    codes = self._callback_codes.get(callback)
+                    if codes is not None:
+                        codes.discard(frame_code)
+                        if not codes:
+                            del self._callback_codes[callback]
+                    logger.info(f"Unregistered callback {getattr(callback, '__name__', repr(callback))} for code 0x{frame_code:02X}")
+                else:
+                    logger.warning(f"Callback {getattr(callback, '__name__', repr(callback))} not found for code 0x{frame_code:02X}")
+
     async def unregister_notification_callback(self, frame_code: int, callback: NotificationCallback) -> None:
         """Unregisters a notification callback for a specific frame code."""
         async with self._callback_lock:
-            if frame_code in self._notification_callbacks:
-                try:
-                    self._notification_callbacks[frame_code].remove(callback)
+            current = self._notification_callbacks.get(frame_code)
+            if current is not None:
+                if callback in current:
+                    remaining = tuple(cb for cb in current if cb != callback)
+                    if remaining:
+                        self._notification_callbacks[frame_code] = remaining
+                    else:
+                        # Drop the frame_code key once the tuple is empty
+                        del self._notification_callbacks[frame_code]
+                    codes = self._callback_codes.get(callback)
+                    if codes is not None:
+                        codes.discard(frame_code)
+                        if not codes:
+                            del self._callback_codes[callback]
                     logger.info(f"Unregistered callback {getattr(callback, '__name__', repr(callback))} for code 0x{frame_code:02X}")
-                    # Optional: Remove the frame_code key if the list becomes empty
-                    if not self._notification_callbacks[frame_code]:
-                         del self._notification_callbacks[frame_code]
-                except ValueError:
+                else:
                     logger.warning(f"Callback {getattr(callback, '__name__', repr(callback))} not found for code 0x{frame_code:02X}")
             else:
                  logger.warning(f"No callbacks registered for code 0x{frame_code:02X} to unregister from.")
@@ -259,22 +613,18 @@ class Dispatcher:
     async def unregister_callback_from_all(self, callback: NotificationCallback) -> None:
          """Unregisters a specific callback from all notification codes it might be registered for."""
          async with self._callback_lock:
+              # The reverse index names exactly the codes this callback is
+              # registered for, so only those tuples are touched.
               unregistered_count = 0
-              codes_to_remove = []
-              for frame_code, callback_list in self._notification_callbacks.items():
-                   if callback in callback_list:
-                        try:
-                             callback_list.remove(callback)
-                             logger.debug(f"Unregistered callback {getattr(callback, '__name__', repr(callback))} from code 0x{frame_code:02X}")
-                             unregistered_count += 1
-                             if not callback_list:
-                                  codes_to_remove.append(frame_code)
-                        except ValueError:
-                             # Should not happen if `callback in callback_list` is true, but safety check
-                             pass 
-              # Remove empty lists outside the loop
-              for code in codes_to_remove:
-                   del self._notification_callbacks[code]
+              for frame_code in self._callback_codes.pop(callback, ()):
+                   registered = self._notification_callbacks.get(frame_code, ())
+                   remaining = tuple(cb for cb in registered if cb != callback)
+                   if remaining:
+                        self._notification_callbacks[frame_code] = remaining
+                   else:
+                        self._notification_callbacks.pop(frame_code, None)
+                   logger.debug(f"Unregistered callback {getattr(callback, '__name__', repr(callback))} from code 0x{frame_code:02X}")
+                   unregistered_count += 1
               if unregistered_count > 0:
                    logger.info(f"Unregistered callback {getattr(callback, '__name__', repr(callback))} from {unregistered_count} notification code(s).")
               else:
@@ -289,12 +639,17 @@ class Dispatcher:
     async def cleanup(self) -> None:
         """Cleans up resources, like cancelling pending futures."""
         logger.debug("Dispatcher cleaning up...")
-        async with self._response_lock:
-            for code, future in self._pending_responses.items():
+        for code, future in self._pending_responses.items():
+            if not future.done():
+                logger.warning(f"Cancelling pending response future for command 0x{code:02X} during cleanup.")
+                future.cancel("Dispatcher cleanup")
+        self._pending_responses.clear()
+        for code, waiters in self._pending_overflow.items():
+            for future in waiters:
                 if not future.done():
-                    logger.warning(f"Cancelling pending response future for command 0x{code:02X} during cleanup.")
+                    logger.warning(f"Cancelling queued response future for command 0x{code:02X} during cleanup.")
                     future.cancel("Dispatcher cleanup")
-            self._pending_responses.clear()
+        self._pending_overflow.clear()
         # No need to explicitly clear callbacks list, but good practice if needed elsewhere
         # async with self._callback_lock:
         #     self._notification_callbacks.clear()
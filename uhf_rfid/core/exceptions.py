@@ -11,10 +11,20 @@ from uhf_rfid.protocols.cph import constants as cph_const
 
 class UhfRfidError(Exception):
     """Base exception class for all uhf_rfid_async errors."""
+    # Note: BaseException still gives instances a __dict__, so __slots__
+    # here and in the subclasses doesn't shrink the objects; it gives the
+    # declared attributes direct descriptor access and documents each
+    # class's attribute set.
+    __slots__ = ()
+
     def __init__(self, message="An unspecified RFID error occurred."):
         super().__init__(message)
 
 
+# Historical name for the base exception, still imported by utils and tests.
+RFIDError = UhfRfidError
+
+
 # --- Transport Layer Exceptions ---
 
 class TransportError(UhfRfidError):
@@ -22,6 +32,8 @@ class TransportError(UhfRfidError):
     Base exception for errors related to the communication transport layer
     (Serial, TCP, UDP, Mock). It often wraps a lower-level exception.
     """
+    __slots__ = ('original_exception',)
+
     def __init__(self, message="Transport layer error.", original_exception: Exception | None = None):
         """
         Args:
@@ -45,6 +57,8 @@ class ConnectionError(TransportError):
     Exception raised when establishing a connection fails.
     This is more specific than a general TransportError during an active connection.
     """
+    __slots__ = ()
+
     def __init__(self, message="Failed to establish connection.", original_exception: Exception | None = None):
         super().__init__(message, original_exception)
 
@@ -58,6 +72,8 @@ class SerialConnectionError(ConnectionError):
     - Port is already in use by another application.
     - Device not physically connected or powered on.
     """
+    __slots__ = ('port',)
+
     def __init__(self, port: str | None = None, message="Serial connection error.", original_exception: Exception | None = None):
         msg = f"Serial connection error"
         if port:
@@ -76,6 +92,8 @@ class NetworkConnectionError(ConnectionError):
     - DNS resolution failed (invalid hostname).
     - Network interface down.
     """
+    __slots__ = ('host', 'port')
+
     def __init__(self, host: str | None = None, port: int | None = None, message="Network connection error.", original_exception: Exception | None = None):
         msg = f"Network connection error"
         if host and port:
@@ -90,12 +108,16 @@ class NetworkConnectionError(ConnectionError):
 
 class ReadError(TransportError):
     """Exception raised when reading data from the transport fails unexpectedly."""
+    __slots__ = ()
+
     def __init__(self, message="Failed to read data from transport.", original_exception: Exception | None = None):
         super().__init__(message, original_exception)
 
 
 class WriteError(TransportError):
     """Exception raised when writing data to the transport fails unexpectedly."""
+    __slots__ = ()
+
     def __init__(self, message="Failed to write data to transport.", original_exception: Exception | None = None):
         super().__init__(message, original_exception)
 
@@ -106,6 +128,8 @@ class TimeoutError(TransportError):
     does not complete within the allocated time. This often indicates a
     communication breakdown or a non-responsive reader.
     """
+    __slots__ = ()
+
     def __init__(self, message="Operation timed out waiting for reader response."):
         # Inheriting from TransportError as timeouts often stem from comms issues.
         # Pass original_exception=None as it's usually generated internally by the library logic,
@@ -117,43 +141,75 @@ class TimeoutError(TransportError):
 
 class ProtocolError(UhfRfidError):
     """Exception related to protocol framing, parsing, or validation."""
+    __slots__ = ()
+
     def __init__(self, message="Protocol error."):
         super().__init__(message)
 
 
 class ChecksumError(ProtocolError):
     """Exception raised when frame checksum validation fails."""
+    __slots__ = ('calculated_checksum', 'received_checksum', 'frame', '_str_cache')
+
     def __init__(self, calculated_checksum: int, received_checksum: int, frame: bytes):
-        message = (
-            f"Checksum mismatch. Calculated: 0x{calculated_checksum:02X}, "
-            f"Received: 0x{received_checksum:02X}."
-            # Limit frame length in message for readability
-            f" Frame (hex): {frame[:32].hex(' ').upper()}{'...' if len(frame)>32 else ''}"
-        )
-        super().__init__(message)
+        # Attribute stores only: corrupt-frame recovery constructs (and
+        # swallows) these on the receive path, so the message with its hex
+        # dump is only built if the exception is actually rendered.
+        super().__init__()
         self.calculated_checksum = calculated_checksum
         self.received_checksum = received_checksum
         self.frame = frame
+        self._str_cache: Optional[str] = None
+
+    def __str__(self):
+        if self._str_cache is None:
+            self._str_cache = (
+                f"Checksum mismatch. Calculated: 0x{self.calculated_checksum:02X}, "
+                f"Received: 0x{self.received_checksum:02X}."
+                # Limit frame length in message for readability
+                f" Frame (hex): {bytes(self.frame[:32]).hex(' ').upper()}{'...' if len(self.frame)>32 else ''}"
+            )
+        return self._str_cache
 
 
 class FrameParseError(ProtocolError):
     """Exception raised during the parsing of a received frame's structure."""
+    __slots__ = ('frame_part', '_message', '_str_cache')
+
     def __init__(self, message="Failed to parse frame structure.", frame_part: bytes | None = None):
-        msg = f"Frame parsing error: {message}"
-        if frame_part:
-            msg += f" Near bytes: {frame_part[:32].hex(' ').upper()}{'...' if len(frame_part)>32 else ''}"
-        super().__init__(msg)
+        # Raised (and often swallowed) for every incomplete frame while a
+        # stream trickles in, so the hex suffix is deferred to __str__.
+        super().__init__()
+        self._message = message
         self.frame_part = frame_part
+        self._str_cache: Optional[str] = None
+
+    def __str__(self):
+        if self._str_cache is None:
+            msg = f"Frame parsing error: {self._message}"
+            if self.frame_part:
+                msg += f" Near bytes: {bytes(self.frame_part[:32]).hex(' ').upper()}{'...' if len(self.frame_part)>32 else ''}"
+            self._str_cache = msg
+        return self._str_cache
 
 
 class TLVParseError(ProtocolError):
     """Exception raised during the parsing of TLV structures within a frame."""
+    __slots__ = ('tlv_data', '_message', '_str_cache')
+
     def __init__(self, message="Failed to parse TLV structure.", tlv_data: bytes | None = None):
-        msg = f"TLV parsing error: {message}"
-        if tlv_data:
-            msg += f" Near bytes: {tlv_data[:32].hex(' ').upper()}{'...' if len(tlv_data)>32 else ''}"
-        super().__init__(msg)
+        super().__init__()
+        self._message = message
         self.tlv_data = tlv_data
+        self._str_cache: Optional[str] = None
+
+    def __str__(self):
+        if self._str_cache is None:
+            msg = f"TLV parsing error: {self._message}"
+            if self.tlv_data:
+                msg += f" Near bytes: {bytes(self.tlv_data[:32]).hex(' ').upper()}{'...' if len(self.tlv_data)>32 else ''}"
+            self._str_cache = msg
+        return self._str_cache
 
 
 # --- Command/Reader Logic Exceptions ---
@@ -163,41 +219,76 @@ class CommandError(UhfRfidError):
     Exception representing an error reported by the reader in a response frame's
     status code, OR an error during command encoding/decoding.
     """
+    __slots__ = ('status_code', 'frame', '_message', '_str_cache')
+
     def __init__(self, status_code: Optional[int] = None, frame: Optional[bytes] = None, message: Optional[str] = None):
+        # Construction is deliberately just attribute stores: the dispatcher
+        # creates one of these per error response, and the message (status
+        # lookup plus frame hex dump) is only worth building if the
+        # exception is actually stringified.
         self.status_code = status_code
         self.frame = frame
-        self.error_message = "Unknown error"
-
-        final_message: str
-        if message:
-            # If a specific message is provided (e.g., for encoding/decoding errors)
-            final_message = message
-        elif status_code is not None:
-            # If status code is provided, generate message from it
-            self.error_message = cph_const.CPH_STATUS_MESSAGES.get(
-                status_code,
-                f"Unknown reader status code: 0x{status_code:02X}"
+        self._message = message
+        self._str_cache: Optional[str] = None
+        super().__init__()
+
+    @property
+    def error_message(self) -> str:
+        """Human-readable reader status text (lazily resolved)."""
+        if self._message is None and self.status_code is not None:
+            return cph_const.CPH_STATUS_MESSAGES.get(
+                self.status_code,
+                f"Unknown reader status code: 0x{self.status_code:02X}"
             )
+        return "Unknown error"
+
+    def __str__(self):
+        if self._str_cache is not None:
+            return self._str_cache
+        if self._message:
+            # A specific message was provided (e.g., for encoding/decoding errors)
+            base_message = self._message
+        elif self.status_code is not None:
             # Prepend "Reader Error:" to distinguish from library errors
-            final_message = f"Reader Error (0x{status_code:02X}): {self.error_message}"
+            base_message = f"Reader Error (0x{self.status_code:02X}): {self.error_message}"
         else:
             # Fallback if neither message nor status_code is given
-            final_message = "Command execution failed with unspecified error."
-
-        super().__init__(final_message)
-
-    def __str__(self):
-        base_message = super().__str__()
+            base_message = "Command execution failed with unspecified error."
         if self.frame:
              # Limit frame length in message for readability
-            return f"{base_message} Frame (hex): {self.frame[:32].hex(' ').upper()}{'...' if len(self.frame)>32 else ''}"
+            base_message = f"{base_message} Frame (hex): {bytes(self.frame[:32]).hex(' ').upper()}{'...' if len(self.frame)>32 else ''}"
+        self._str_cache = base_message
         return base_message
 
+class InvalidTagDataError(UhfRfidError):
+    """
+    Exception raised when tag data (EPC, TID, memory contents) is malformed
+    or fails validation before/after a tag operation.
+    """
+    __slots__ = ()
+
+    def __init__(self, message="Invalid tag data."):
+        super().__init__(message)
+
+
+class UnknownTagError(UhfRfidError):
+    """
+    Exception raised when a tag cannot be identified against the known
+    tag definitions, or a targeted tag is not present/recognized.
+    """
+    __slots__ = ()
+
+    def __init__(self, message="Unknown or unrecognized tag."):
+        super().__init__(message)
+
+
 class UnexpectedResponseError(ProtocolError):
     """
     Exception raised when the received response frame type or code
     does not match the expected response for the sent command.
     """
+    __slots__ = ('request_frame', 'response_frame')
+
     def __init__(self, message="Received unexpected response from reader.", request_frame: bytes | None = None, response_frame: bytes | None = None):
         super().__init__(message)
         self.request_frame = request_frame
@@ -1,8 +1,11 @@
 # uhf_rfid/core/reader.py
 
 import asyncio
+import contextlib
+import functools
 import logging
-from typing import Optional, Any, Callable, Coroutine, Dict, Tuple, Union, cast
+import re
+from typing import Optional, Any, Callable, Coroutine, Dict, List, Sequence, Tuple, Union, cast
 import datetime
 
 # Import parameter dataclasses for type hinting
@@ -18,9 +21,8 @@ from uhf_rfid.core.dispatcher import Dispatcher, NotificationCallback
 from uhf_rfid.core.exceptions import UhfRfidError, TransportError, ConnectionError, TimeoutError, CommandError, \
     ProtocolError
 from uhf_rfid.core.status import ConnectionStatus
-from uhf_rfid.protocols.base_protocol import BaseProtocol, DeviceInfo, TagReadData
+from uhf_rfid.protocols.base_protocol import BaseProtocol, BytesLike, DeviceInfo, TagReadData
 from uhf_rfid.transport.base import BaseTransport
-# from uhf_rfid.core.reader_state import ReaderState # Remove incorrect import
 # from uhf_rfid.core.schemas.common import TagInfo, FrequencyHop, LockAction, MemoryBank # Remove incorrect import
 # import struct # Removed
 
@@ -31,6 +33,82 @@ TagNotifyCallback = Callable[[TagReadData], Coroutine[Any, Any, None]]
 StateChangeCallback = Callable[[ConnectionStatus], Coroutine[Any, Any, None]]
 ErrorCallback = Callable[[Exception], Coroutine[Any, Any, None]]
 
+# Payloads above this size get their TLV encode/decode pushed to the default
+# executor so bulk tag-memory transfers don't stall notification dispatch on
+# the event loop; tiny commands stay inline to keep their latency low.
+ENCODE_OFFLOAD_THRESHOLD = 64
+
+def _encode_empty() -> bytes:
+    """Fallback encoder for query commands whose request carries no parameters."""
+    return b''
+
+
+# How many commands a batch helper keeps in flight at once. The dispatcher
+# matches same-code responses FIFO, so the window only bounds memory and
+# reader-side queueing, not correctness.
+MAX_INFLIGHT_COMMANDS = 8
+
+
+def _should_offload(args: Dict[Any, Any]) -> bool:
+    """True when 'args' carries a payload big enough to encode/decode off-loop.
+
+    Works for both encode kwargs (a 'data' key) and parsed response dicts
+    (bytes values keyed by TLV tag).
+    """
+    data = args.get('data')
+    if data is not None and hasattr(data, '__len__'):
+        return len(data) > ENCODE_OFFLOAD_THRESHOLD
+    return any(
+        isinstance(value, (bytes, bytearray)) and len(value) > ENCODE_OFFLOAD_THRESHOLD
+        for value in args.values()
+    )
+
+
+# Exactly eight hex digits: validated up front so the valid path never sets
+# up exception handling and the invalid path raises once, unwrapped.
+_match_hex_password = re.compile(r'[0-9A-Fa-f]{8}\Z').match
+
+
+# Valid passwords are always 8 characters, so the debug mask is a constant;
+# computing '*' * len(...) per log line bought nothing.
+_PW_MASK = '********'
+_NO_PW = 'None'
+
+
+def _mask_password(password: Optional[str]) -> str:
+    """Returns the constant placeholder used when logging password arguments."""
+    return _PW_MASK if password else _NO_PW
+
+
+def _parse_password(password: Optional[str], kind: str = "Access") -> Optional[bytes]:
+    """Parses a 4-byte hex password string once at the API boundary.
+
+    The encoders then receive ready bytes instead of re-parsing (and
+    re-validating) the string deep in the protocol layer.
+    """
+    if password is None:
+        return None
+    if not (isinstance(password, str) and _match_hex_password(password)):
+        raise ValueError(f"{kind} password must be a valid 8-character hexadecimal string (4 bytes)")
+    return bytes.fromhex(password)
+
+
+@contextlib.contextmanager
+def _encode_errors(command_code: int):
+    """Wraps request-encoding failures into the documented exception types."""
+    try:
+        yield
+    except (ProtocolError, ValueError, TypeError) as e:
+        logger.error(f"Protocol error encoding command 0x{command_code:02X}: {e}")
+        # Wrap encoding error in CommandError with the original message
+        raise CommandError(message=f"Failed to encode request for command 0x{command_code:02X}: {e}") from e
+    except NotImplementedError:
+        logger.error(f"Protocol does not implement encoding for command 0x{command_code:02X}")
+        raise
+    except Exception as e:
+        logger.exception(f"Unexpected error encoding command 0x{command_code:02X}")
+        raise CommandError(message=f"Unexpected error encoding request: {e}") from e
+
 class Reader:
     """
     Main class for interacting with a UHF RFID reader using a specified protocol.
@@ -38,6 +116,20 @@ class Reader:
     and handling tag notifications.
     """
 
+    # Slots drop the per-instance __dict__: the hot command path reads
+    # self._dispatcher / self._state / self._protocol on every call, and a
+    # slot is a fixed-offset load instead of a dict lookup.
+    __slots__ = (
+        '_transport', '_protocol', '_response_timeout',
+        '_dispatcher', '_state', '_status_change_callback',
+        '_tag_callbacks_set', '_tag_callbacks_snapshot',
+        '_state_callbacks_set', '_state_callbacks_snapshot',
+        '_error_callbacks_set', '_error_callbacks_snapshot',
+        '_cmd_table', '_set_table',
+        '_NOTIF_TAG', '_NOTIF_OFFLINE_TAG', '_NOTIF_RECORD', '_NOTIF_HEARTBEAT',
+        '_command_window', '_status_tasks',
+    )
+
     def __init__(self, transport: BaseTransport, protocol: BaseProtocol, response_timeout: float = 2.0):
         """
         Initializes the Reader.
@@ -58,14 +150,97 @@ class Reader:
 
         self._dispatcher: Optional[Dispatcher] = None
         self._state: ConnectionStatus = ConnectionStatus.DISCONNECTED
-        self._status_lock = asyncio.Lock()
         self._status_change_callback: Optional[Callable[[ConnectionStatus], Any]] = None
-        self._tag_callbacks: List[TagNotifyCallback] = []
-        self._state_callbacks: List[StateChangeCallback] = []
-        self._error_callbacks: List[ErrorCallback] = []
-        self._command_lock = asyncio.Lock()
-
-        logger.debug(f"Reader initialized with transport: {type(transport).__name__} and protocol: {type(protocol).__name__}")
+        # Callback registries: a set gives O(1) add/remove, the tuple snapshot
+        # (rebuilt on mutation) is what dispatch iterates, so fan-out never
+        # sees a collection mutated mid-iteration.
+        # Strong references to in-flight status-callback tasks: the event
+        # loop only holds weak ones, so without this a fire-and-forget task
+        # could be garbage-collected mid-execution.
+        self._status_tasks: set = set()
+        self._tag_callbacks_set: set = set()
+        self._tag_callbacks_snapshot: Tuple[TagNotifyCallback, ...] = ()
+        self._state_callbacks_set: set = set()
+        self._state_callbacks_snapshot: Tuple[StateChangeCallback, ...] = ()
+        self._error_callbacks_set: set = set()
+        self._error_callbacks_snapshot: Tuple[ErrorCallback, ...] = ()
+
+        # Pre-bound (command_code, encode_func, decode_func) triples for the
+        # no-argument commands, so polling loops (e.g. repeated get_power)
+        # don't re-resolve the same protocol attributes on every call.
+        self._cmd_table: Dict[str, Tuple[int, Callable[[], bytes], Optional[Callable[[Dict[Any, Any]], Any]]]] = {
+            'get_version': (cph_const.CMD_GET_VERSION, protocol.encode_get_version_request, protocol.decode_get_version_response),
+            'reboot_reader': (cph_const.CMD_REBOOT, protocol.encode_reboot_request, None),
+            'set_default_params': (cph_const.CMD_SET_DEFAULT_PARAM, protocol.encode_set_default_params_request, None),
+            'stop_inventory': (cph_const.CMD_STOP_INVENTORY, protocol.encode_stop_inventory_request, None),
+            # The query encoders are optional protocol extensions, so fall
+            # back to an empty-parameter request like the other get_* paths.
+            # Resolving them here (once) also means the getters allocate no
+            # fresh lambda default per call while polling.
+            'get_power': (cph_const.CMD_QUERY_PARAMETER, getattr(protocol, 'encode_get_power_request', _encode_empty), protocol.decode_get_power_response),
+            'get_buzzer_status': (cph_const.CMD_QUERY_PARAMETER, getattr(protocol, 'encode_get_buzzer_request', _encode_empty), protocol.decode_get_buzzer_response),
+            'get_filter_time': (cph_const.CMD_QUERY_PARAMETER, getattr(protocol, 'encode_get_filter_time_request', _encode_empty), protocol.decode_get_filter_time_response),
+            'get_rtc_time': (cph_const.CMD_QUERY_RTC_TIME, getattr(protocol, 'encode_get_rtc_request', _encode_empty), protocol.decode_get_rtc_response),
+            'get_ext_params': (cph_const.CMD_QUERY_EXT_PARAM, getattr(protocol, 'encode_get_ext_params_request', _encode_empty), protocol.decode_get_ext_params_response),
+            'get_working_params': (cph_const.CMD_QUERY_WORKING_PARAM, getattr(protocol, 'encode_get_working_params_request', _encode_empty), protocol.decode_get_working_params_response),
+            'get_transport_params': (cph_const.CMD_QUERY_TRANSPORT_PARAM, getattr(protocol, 'encode_get_transport_params_request', _encode_empty), protocol.decode_get_transport_params_response),
+            'get_advance_params': (cph_const.CMD_QUERY_ADVANCE_PARAM, getattr(protocol, 'encode_get_advance_params_request', _encode_empty), protocol.decode_get_advance_params_response),
+            'get_usb_data_params': (cph_const.CMD_QUERY_USB_DATA, getattr(protocol, 'encode_get_usb_data_params_request', _encode_empty), protocol.decode_get_usb_data_params_response),
+            'get_data_flag_params': (cph_const.CMD_QUERY_DATA_FLAG, getattr(protocol, 'encode_get_data_flag_params_request', _encode_empty), protocol.decode_get_data_flag_params_response),
+            'get_modbus_params': (cph_const.CMD_QUERY_MODBUS_PARAM, getattr(protocol, 'encode_get_modbus_params_request', _encode_empty), protocol.decode_get_modbus_params_response),
+        }
+        # Same idea for the single-argument parameter setters: each public
+        # set_* method keeps its typed signature but delegates through one
+        # pre-bound (command_code, encode_func) pair.
+        self._set_table: Dict[str, Tuple[int, Callable[..., bytes]]] = {
+            'set_power': (cph_const.CMD_SET_PARAMETER, protocol.encode_set_power_request),
+            'set_buzzer': (cph_const.CMD_SET_PARAMETER, protocol.encode_set_buzzer_request),
+            'set_filter_time': (cph_const.CMD_SET_PARAMETER, protocol.encode_set_filter_time_request),
+            'relay_operation': (cph_const.CMD_RELAY_OP, protocol.encode_relay_op_request),
+            'play_audio': (cph_const.CMD_AUDIO_PLAY, protocol.encode_audio_play_request),
+            'set_rtc_time': (cph_const.CMD_SET_RTC_TIME, protocol.encode_set_rtc_request),
+            'set_ext_params': (cph_const.CMD_SET_EXT_PARAM, protocol.encode_set_ext_params_request),
+            'set_working_params': (cph_const.CMD_SET_WORKING_PARAM, protocol.encode_set_working_params_request),
+            'set_transport_params': (cph_const.CMD_SET_TRANSPORT_PARAM, protocol.encode_set_transport_params_request),
+            'set_advance_params': (cph_const.CMD_SET_ADVANCE_PARAM, protocol.encode_set_advance_params_request),
+            'set_usb_data_params': (cph_const.CMD_SET_USB_DATA, protocol.encode_set_usb_data_params_request),
+            'set_data_flag_params': (cph_const.CMD_SET_DATA_FLAG, protocol.encode_set_data_flag_params_request),
+            'set_modbus_params': (cph_const.CMD_SET_MODBUS_PARAM, protocol.encode_set_modbus_params_request),
+        }
+        # Notification codes resolved once here instead of per register call;
+        # a constants module missing any of them fails early at construction.
+        try:
+            self._NOTIF_TAG = cph_const.NOTIF_TAG_UPLOADED
+            self._NOTIF_OFFLINE_TAG = cph_const.NOTIF_OFFLINE_TAG_UPLOADED
+            self._NOTIF_RECORD = cph_const.NOTIF_RECORD_UPLOADED
+            self._NOTIF_HEARTBEAT = cph_const.NOTIF_HEARTBEAT
+        except AttributeError as e:
+            raise NotImplementedError(f"Missing notification constant: {e}") from e
+
+        # No command lock: the dispatcher multiplexes concurrent commands
+        # itself (per-code Future map with FIFO overflow), so concurrent
+        # tasks like get_power() + set_buzzer() overlap on the wire.
+        self._command_window = asyncio.Semaphore(MAX_INFLIGHT_COMMANDS)
+
+        logger.debug("Reader initialized with transport: %s and protocol: %s", type(transport).__name__, type(protocol).__name__)
+
+    @classmethod
+    def install_uvloop(cls) -> bool:
+        """Installs uvloop as the event loop policy, if available.
+
+        Call once before asyncio.run(): the libuv-backed loop speeds up task
+        scheduling and socket I/O, which helps notification-heavy inventory
+        workloads. Returns False (and keeps the default loop) when uvloop is
+        not installed, e.g. on Windows.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            logger.info("uvloop not available; keeping the default event loop policy.")
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("uvloop event loop policy installed.")
+        return True
 
     @property
     def status(self) -> ConnectionStatus:
@@ -82,72 +257,87 @@ class Reader:
         """Returns the current state of the reader."""
         return self._state
 
-    async def _update_status(self, new_status: ConnectionStatus):
-        """Atomically updates the connection status and calls the callback."""
-        async with self._status_lock:
-            if self._state != new_status:
-                logger.info(f"Reader status changed: {self._state.name} -> {new_status.name}")
-                self._state = new_status
-                if self._state_callbacks:
-                    tasks = [asyncio.create_task(cb(new_status)) for cb in self._state_callbacks]
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                if self._status_change_callback:
-                    try:
-                        # Run callback in a separate task to avoid blocking status update
-                        asyncio.create_task(self._run_status_callback(new_status))
-                    except Exception as e:
-                        logger.error(f"Error invoking status change callback: {e}")
-
-    async def _run_status_callback(self, status: ConnectionStatus):
-         """Helper to safely run the status callback."""
-         if self._status_change_callback:
-              if asyncio.iscoroutinefunction(self._status_change_callback):
-                   await self._status_change_callback(status)
-              else:
-                   self._status_change_callback(status)
+    def _set_status(self, new_status: ConnectionStatus) -> list:
+        """Updates the connection status and schedules the callbacks.
+
+        The compare-and-set is plain synchronous code with no await point,
+        so under asyncio's cooperative scheduling it cannot be interleaved
+        with another transition and needs no lock.
+        """
+        if self._state == new_status:
+            return []
+        logger.info("Reader status changed: %s -> %s", self._state.name, new_status.name)
+        self._state = new_status
+        callbacks = self._state_callbacks_snapshot
+        if self._status_change_callback:
+            callbacks += (self._status_change_callback,)
+        # Fire-and-forget: callbacks observe the transition, they don't gate
+        # it, so the connect/disconnect path doesn't await their completion.
+        # The tasks are kept in _status_tasks until done — the loop holds
+        # only weak references, and no call site retains the returned list.
+        loop = asyncio.get_running_loop()
+        tasks = [loop.create_task(cb(new_status)) for cb in callbacks]
+        self._status_tasks.update(tasks)
+        for task in tasks:
+            task.add_done_callback(self._status_tasks.discard)
+        return tasks
 
     def set_status_change_callback(self, callback: Optional[Callable[[ConnectionStatus], Coroutine[Any, Any, None] | None]]):
          """
          Registers a callback function to be notified of connection status changes.
-         The callback can be sync or async.
+         The callback can be sync or async; sync callbacks are wrapped into an
+         async adapter here so dispatch never has to check which kind it got.
          """
          if callback and not callable(callback):
               raise TypeError("Callback must be callable")
+         if callback is not None and not asyncio.iscoroutinefunction(callback):
+              sync_callback = callback
+
+              async def _status_callback_adapter(status: ConnectionStatus) -> None:
+                   sync_callback(status)
+
+              callback = _status_callback_adapter
          self._status_change_callback = callback
 
     async def connect(self) -> None:
         """
         Establishes connection to the reader and initializes the dispatcher.
+
+        For notification-heavy workloads, Reader.install_uvloop() may be
+        called once before asyncio.run() to speed up the event loop.
         """
         if self.is_connected:
             logger.warning("Already connected.")
             return
-        if self._state == ReaderState.CONNECTING:
+        if self._state == ConnectionStatus.CONNECTING:
              logger.warning("Connection already in progress.")
              return
 
-        await self._update_status(ReaderState.CONNECTING)
+        self._set_status(ConnectionStatus.CONNECTING)
         try:
-            # Initialize dispatcher *before* connecting transport might be safer
-            # if transport connect starts reading immediately.
+            # Kick off the transport handshake first, then build the
+            # dispatcher while it is in flight. The task only starts running
+            # at the await below, so the dispatcher's data callback is
+            # registered before any bytes can arrive.
+            connect_task = asyncio.get_running_loop().create_task(
+                self._transport.connect()
+            )
             self._dispatcher = Dispatcher(
                 transport=self._transport,
                 protocol=self._protocol,
-                notification_handler=self._handle_notification,
-                error_handler=self._report_error
+                response_timeout=self._response_timeout,
             )
-            self._dispatcher.start()
             logger.debug("Dispatcher initialized.")
 
-            await self._transport.connect() # Transport handles its own exceptions (ConnectionError)
+            await connect_task # Transport handles its own exceptions (ConnectionError)
 
             # If connect succeeds, transport should start its read loop which feeds the dispatcher
-            await self._update_status(ReaderState.CONNECTED)
-            logger.info(f"Reader connected via {type(self._transport).__name__}")
+            self._set_status(ConnectionStatus.CONNECTED)
+            logger.info("Reader connected via %s", type(self._transport).__name__)
 
         except ConnectionError as e:
             logger.error(f"Connection failed: {e}")
-            await self._update_status(ReaderState.ERROR)
+            self._set_status(ConnectionStatus.ERROR)
             # Clean up dispatcher if it was created but connection failed
             if self._dispatcher:
                  await self._dispatcher.cleanup()
@@ -155,7 +345,7 @@ class Reader:
             raise # Re-raise ConnectionError
         except Exception as e:
             logger.exception(f"Unexpected error during connection: {e}")
-            await self._update_status(ReaderState.ERROR)
+            self._set_status(ConnectionStatus.ERROR)
             if self._dispatcher:
                  await self._dispatcher.cleanup()
                  self._dispatcher = None
@@ -166,14 +356,14 @@ class Reader:
         """
         Disconnects from the reader and cleans up resources.
         """
-        if self._state == ReaderState.DISCONNECTED:
+        if self._state == ConnectionStatus.DISCONNECTED:
             # logger.debug("Already disconnected.") # Can be noisy
             return
-        if self._state == ReaderState.DISCONNECTING:
+        if self._state == ConnectionStatus.DISCONNECTING:
              logger.warning("Disconnection already in progress.")
              return
 
-        await self._update_status(ReaderState.DISCONNECTING)
+        self._set_status(ConnectionStatus.DISCONNECTING)
         try:
             # Stop dispatcher first to prevent processing during/after disconnect
             if self._dispatcher:
@@ -193,7 +383,7 @@ class Reader:
             # Log but proceed to set status to disconnected
         finally:
             # Always update status, even if errors occurred during cleanup
-            await self._update_status(ReaderState.DISCONNECTED)
+            self._set_status(ConnectionStatus.DISCONNECTED)
 
     async def register_tag_callback(self, callback: NotificationCallback) -> None:
         """
@@ -202,20 +392,22 @@ class Reader:
         The callback will receive (frame_type, address, frame_code, parsed_params)
         when a tag notification (e.g., frame code 0x80) is received.
         """
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             logger.warning("Cannot register callback: Not connected (Dispatcher not initialized).")
             # Or raise an error? raise UhfRfidError("Not connected")
             return
         if not asyncio.iscoroutinefunction(callback):
              raise TypeError("Tag callback must be an async function (defined with 'async def')")
-        await self._dispatcher.register_notification_callback(callback)
+        await disp.register_notification_callback(callback)
 
     async def unregister_tag_callback(self, callback: NotificationCallback) -> None:
         """Unregisters a previously registered tag notification callback."""
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             logger.warning("Cannot unregister callback: Not connected.")
             return
-        await self._dispatcher.unregister_notification_callback(callback)
+        await disp.unregister_notification_callback(callback)
 
     # --- NEW Specific Notification Callback Registration Methods ---
 
@@ -224,126 +416,122 @@ class Reader:
         Registers an asynchronous callback for tag notifications (online 0x80 and offline 0x81).
         The callback receives (frame_type, address, frame_code, parsed_params).
         """
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             raise UhfRfidError("Cannot register callback: Not connected.")
         if not asyncio.iscoroutinefunction(callback):
              raise TypeError("Callback must be an async function (defined with 'async def')")
         # Register for both standard (0x80) and offline (0x81) tag uploads
-        try:
-             await self._dispatcher.register_notification_callback(cph_const.NOTIF_TAG_UPLOADED, callback)
-             await self._dispatcher.register_notification_callback(cph_const.NOTIF_OFFLINE_TAG_UPLOADED, callback)
-        except AttributeError:
-             logger.error("Missing required constants NOTIF_TAG_UPLOADED or NOTIF_OFFLINE_TAG_UPLOADED")
-             raise NotImplementedError("Missing required notification constants")
+        # in one dispatcher round-trip.
+        await disp.register_notification_callbacks(
+             (self._NOTIF_TAG, self._NOTIF_OFFLINE_TAG), callback)
 
     async def unregister_tag_notify_callback(self, callback: TagNotifyCallback) -> None:
         """Unregisters a callback from tag notifications (0x80, 0x81)."""
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             logger.warning("Cannot unregister callback: Not connected.")
             return
-        try:
-             await self._dispatcher.unregister_notification_callback(cph_const.CMD_TAG_UPLOAD, callback)
-             await self._dispatcher.unregister_notification_callback(cph_const.NOTIF_TAG_UPLOADED, callback)
-             await self._dispatcher.unregister_notification_callback(cph_const.NOTIF_OFFLINE_TAG_UPLOADED, callback)
-        except AttributeError:
-             logger.error("Missing required constants NOTIF_TAG_UPLOADED or NOTIF_OFFLINE_TAG_UPLOADED")
-             # Still try to unregister if possible
-             pass
+        await disp.unregister_notification_callbacks(
+             (self._NOTIF_TAG, self._NOTIF_OFFLINE_TAG), callback)
 
     async def register_record_notify_callback(self, callback: NotificationCallback) -> None:
         """
         Registers an asynchronous callback for buffered record notifications (0x82).
         The callback receives (frame_type, address, frame_code, parsed_params).
         """
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             raise UhfRfidError("Cannot register callback: Not connected.")
         if not asyncio.iscoroutinefunction(callback):
              raise TypeError("Callback must be an async function (defined with 'async def')")
-        try:
-             await self._dispatcher.register_notification_callback(cph_const.NOTIF_RECORD_UPLOADED, callback)
-        except AttributeError:
-             logger.error("Missing required constant NOTIF_RECORD_UPLOADED")
-             raise NotImplementedError("Missing required notification constant")
+        await disp.register_notification_callback(self._NOTIF_RECORD, callback)
 
     async def unregister_record_notify_callback(self, callback: NotificationCallback) -> None:
         """Unregisters a callback from record notifications (0x82)."""
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             logger.warning("Cannot unregister callback: Not connected.")
             return
-        try:
-             await self._dispatcher.unregister_notification_callback(cph_const.NOTIF_RECORD_UPLOADED, callback)
-        except AttributeError:
-             logger.error("Missing required constant NOTIF_RECORD_UPLOADED")
-             pass
+        await disp.unregister_notification_callback(self._NOTIF_RECORD, callback)
 
     async def register_heartbeat_callback(self, callback: NotificationCallback) -> None:
         """
         Registers an asynchronous callback for heartbeat notifications (0x90).
         The callback receives (frame_type, address, frame_code, parsed_params).
         """
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             raise UhfRfidError("Cannot register callback: Not connected.")
         if not asyncio.iscoroutinefunction(callback):
              raise TypeError("Callback must be an async function (defined with 'async def')")
-        try:
-             await self._dispatcher.register_notification_callback(cph_const.NOTIF_HEARTBEAT, callback)
-        except AttributeError:
-             logger.error("Missing required constant NOTIF_HEARTBEAT")
-             raise NotImplementedError("Missing required notification constant")
+        await disp.register_notification_callback(self._NOTIF_HEARTBEAT, callback)
 
     async def unregister_heartbeat_callback(self, callback: NotificationCallback) -> None:
         """Unregisters a callback from heartbeat notifications (0x90)."""
-        if not self._dispatcher:
+        disp = self._dispatcher
+        if disp is None:
             logger.warning("Cannot unregister callback: Not connected.")
             return
-        try:
-             await self._dispatcher.unregister_notification_callback(cph_const.NOTIF_HEARTBEAT, callback)
-        except AttributeError:
-             logger.error("Missing required constant NOTIF_HEARTBEAT")
-             pass
+        await disp.unregister_notification_callback(self._NOTIF_HEARTBEAT, callback)
 
     async def unregister_callback(self, callback: NotificationCallback) -> None:
          """Unregisters a callback from ALL notification types it might be registered for."""
-         if not self._dispatcher:
+         disp = self._dispatcher
+         if disp is None:
               logger.warning("Cannot unregister callback: Not connected.")
               return
-         await self._dispatcher.unregister_callback_from_all(callback)
+         await disp.unregister_callback_from_all(callback)
 
 
     # --- High-level Command Methods ---
     # These methods wrap the dispatcher's send_command_wait_response
 
-    async def _execute_command(self, command_code: int, encode_func: Callable[..., bytes], encode_args: Union[tuple, Dict[str, Any]] = (), decode_func: Optional[Callable[[Dict[Any, Any]], Any]] = None, address: int = 0x0000) -> Any:
-        """Internal helper to execute a command and handle response/errors."""
-        if not self.is_connected or not self._dispatcher:
+    # Command execution is split by argument shape (_kw/_pos plus the
+    # pre-bound fast paths below) so each call site, which statically knows
+    # how it passes encode arguments, reaches its encoder without per-call
+    # isinstance introspection.
+
+    async def _execute_command_kw(self, command_code: int, encode_func: Callable[..., bytes], kwargs: Dict[str, Any], decode_func: Optional[Callable[[Dict[Any, Any]], Any]] = None, address: int = 0x0000) -> Any:
+        """Executes a command whose encoder takes keyword arguments."""
+        disp = self._dispatcher
+        if disp is None or self._state is not ConnectionStatus.CONNECTED:
             raise ConnectionError("Reader not connected.")
 
         params_data: bytes
-        try:
-            # Correctly handle positional or keyword arguments for encode_func
-            if isinstance(encode_args, dict):
-                params_data = encode_func(**encode_args)
-            elif isinstance(encode_args, tuple):
-                params_data = encode_func(*encode_args)
-            else: # Handle single non-tuple/dict arg or empty case
-                params_data = encode_func(encode_args) if encode_args else encode_func()
-        except (ProtocolError, ValueError, TypeError) as e:
-            logger.error(f"Protocol error encoding command 0x{command_code:02X}: {e}")
-            # Wrap encoding error in CommandError with the original message
-            raise CommandError(message=f"Failed to encode request for command 0x{command_code:02X}: {e}") from e
-        except NotImplementedError:
-             logger.error(f"Protocol does not implement encoding for command 0x{command_code:02X}")
-             # Wrap NotImplementedError in a more specific CommandError or re-raise?
-             # Re-raising seems more appropriate here.
-             raise
-        except Exception as e:
-             logger.exception(f"Unexpected error encoding command 0x{command_code:02X}")
-             # Wrap unexpected encoding error in CommandError
-             raise CommandError(message=f"Unexpected error encoding request: {e}") from e
+        with _encode_errors(command_code):
+            if _should_offload(kwargs):
+                # Large payload: build the TLVs in the default executor so
+                # the loop keeps dispatching notifications meanwhile.
+                params_data = await asyncio.get_running_loop().run_in_executor(
+                    None, functools.partial(encode_func, **kwargs)
+                )
+            else:
+                params_data = encode_func(**kwargs)
+
+        return await self._send_and_decode(disp, command_code, params_data, decode_func, address)
+
+    async def _execute_command_pos(self, command_code: int, encode_func: Callable[..., bytes], args: tuple, decode_func: Optional[Callable[[Dict[Any, Any]], Any]] = None, address: int = 0x0000) -> Any:
+        """Executes a command whose encoder takes positional arguments."""
+        disp = self._dispatcher
+        if disp is None or self._state is not ConnectionStatus.CONNECTED:
+            raise ConnectionError("Reader not connected.")
+
+        params_data: bytes
+        with _encode_errors(command_code):
+            params_data = encode_func(*args)
+
+        return await self._send_and_decode(disp, command_code, params_data, decode_func, address)
 
+    async def _send_and_decode(self, disp: Dispatcher, command_code: int, params_data: bytes, decode_func: Optional[Callable[[Dict[Any, Any]], Any]], address: int) -> Any:
+        """Shared send/wait/decode tail of command execution.
+
+        Takes the dispatcher the caller's guard already read, so the send
+        below costs no second attribute lookup.
+        """
         response_params: Dict[Any, Any]
         try:
-            response_params = await self._dispatcher.send_command_wait_response(
+            response_params = await disp.send_command_wait_response(
                 command_code=command_code,
                 address=address,
                 params_data=params_data
@@ -366,7 +554,12 @@ class Reader:
 
         if decode_func:
             try:
-                result = decode_func(response_params)
+                if _should_offload(response_params):
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        None, decode_func, response_params
+                    )
+                else:
+                    result = decode_func(response_params)
                 return result
             except (ProtocolError, ValueError, TypeError, KeyError) as e:
                  logger.error(f"Protocol error decoding response for command 0x{command_code:02X}: {e}")
@@ -376,7 +569,7 @@ class Reader:
             except NotImplementedError:
                  logger.error(f"Protocol does not implement decoding for command 0x{command_code:02X}")
                  # Re-raise NotImplementedError
-            raise
+                 raise
             except Exception as e:
                  logger.exception(f"Unexpected error decoding response for command 0x{command_code:02X}")
                  # Wrap unexpected decoding error in CommandError
@@ -386,186 +579,198 @@ class Reader:
             # Returning None is simpler for now.
             return None
 
-    # --- Device Info / Control --- 
+    async def _execute_command_fast(self, cmd_tuple: Tuple[int, Callable[[], bytes], Optional[Callable[[Dict[Any, Any]], Any]]], address: int = 0x0000) -> Any:
+        """Fast path for the no-argument commands pre-bound in _cmd_table.
+
+        The table entry fixes (command_code, encode_func, decode_func) at
+        __init__ time, so each call skips the per-call attribute lookups of
+        the table-less execution helpers.
+        """
+        disp = self._dispatcher
+        if disp is None or self._state is not ConnectionStatus.CONNECTED:
+            raise ConnectionError("Reader not connected.")
+
+        command_code, encode_func, decode_func = cmd_tuple
+        with _encode_errors(command_code):
+            params_data = encode_func()
+
+        return await self._send_and_decode(disp, command_code, params_data, decode_func, address)
+
+    async def _execute_set_fast(self, cmd_tuple: Tuple[int, Callable[..., bytes]], value: Any, address: int = 0x0000) -> None:
+        """Fast path for the single-argument setters pre-bound in _set_table.
+
+        Setter responses carry no payload beyond the status TLV, so there is
+        no decode step.
+        """
+        disp = self._dispatcher
+        if disp is None or self._state is not ConnectionStatus.CONNECTED:
+            raise ConnectionError("Reader not connected.")
+
+        command_code, encode_func = cmd_tuple
+        with _encode_errors(command_code):
+            params_data = encode_func(value)
+
+        await self._send_and_decode(disp, command_code, params_data, None, address)
+
+    # --- Device Info / Control ---
     async def get_version(self, address: int = 0x0000) -> DeviceInfo:
-        # ... (Correct implementation using _execute_command) ...
-        return await self._execute_command(
-            command_code=cph_const.CMD_GET_VERSION,
-            encode_func=self._protocol.encode_get_version_request,
-            decode_func=self._protocol.decode_get_version_response,
-            address=address
-        )
+        return await self._execute_command_fast(self._cmd_table['get_version'], address=address)
 
     async def reboot_reader(self, address: int = 0x0000) -> None:
-        # ... (Correct implementation using _execute_command) ...
-        await self._execute_command(
-            command_code=cph_const.CMD_REBOOT,
-            encode_func=self._protocol.encode_reboot_request,
-            decode_func=None,
-            address=address
-        )
+        await self._execute_command_fast(self._cmd_table['reboot_reader'], address=address)
 
     async def set_default_params(self, address: int = 0x0000) -> None:
         """
         Resets the reader's parameters to their factory defaults.
         Use with caution.
         """
-        logger.debug(f"Executing set default params (Address: {address})")
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_DEFAULT_PARAM,
-            encode_func=self._protocol.encode_set_default_params_request,
-            address=address
-        )
-        logger.info(f"Set default params command sent successfully (Address: {address})")
+        logger.debug("Executing set default params (Address: %d)", address)
+        await self._execute_command_fast(self._cmd_table['set_default_params'], address=address)
+        logger.info("Set default params command sent successfully (Address: %d)", address)
 
     # --- Inventory ---
     async def start_inventory(self, params: Optional[Any] = None, address: int = 0x0000) -> None:
         """Starts continuous inventory mode."""
         # Params can be Gen2Params or None
-        logger.debug(f"Executing start inventory (Address: {address}, Params: {params})")
-        await self._execute_command(
+        logger.debug("Executing start inventory (Address: %d, Params: %s)", address, params)
+        await self._execute_command_kw(
             command_code=cph_const.CMD_START_INVENTORY,
             encode_func=self._protocol.encode_start_inventory_request,
-            encode_args={"params": params} if params else {},
+            kwargs={"params": params} if params else {},
             address=address
         )
-        logger.info(f"Start inventory command sent successfully (Address: {address})")
+        logger.info("Start inventory command sent successfully (Address: %d)", address)
 
     async def stop_inventory(self, address: int = 0x0000) -> None:
         """Stops continuous inventory mode."""
-        logger.debug(f"Executing stop inventory (Address: {address})")
-        await self._execute_command(
-            command_code=cph_const.CMD_STOP_INVENTORY,
-            encode_func=self._protocol.encode_stop_inventory_request,
-            address=address
-        )
-        logger.info(f"Stop inventory command sent successfully (Address: {address})")
+        logger.debug("Executing stop inventory (Address: %d)", address)
+        await self._execute_command_fast(self._cmd_table['stop_inventory'], address=address)
+        logger.info("Stop inventory command sent successfully (Address: %d)", address)
 
     async def inventory_single_burst(self, params: Optional[Any] = None, address: int = 0x0000) -> None:
         """Performs a single inventory burst."""
         # Params can be Gen2Params or None
-        logger.debug(f"Executing inventory single burst (Address: {address}, Params: {params})")
-        await self._execute_command(
+        logger.debug("Executing inventory single burst (Address: %d, Params: %s)", address, params)
+        await self._execute_command_kw(
             command_code=cph_const.CMD_ACTIVE_INVENTORY,
             encode_func=self._protocol.encode_inventory_single_burst_request,
-            encode_args={"params": params} if params else {},
+            kwargs={"params": params} if params else {},
             address=address
         )
-        logger.info(f"Inventory single burst command sent successfully (Address: {address})")
+        logger.info("Inventory single burst command sent successfully (Address: %d)", address)
 
     # --- Single Parameters --- 
     async def set_power(self, power_dbm: int, address: int = 0x0000) -> None:
         """Sets the reader's transmission power."""
-        logger.debug(f"Executing set power (Address: {address}, Power: {power_dbm} dBm)")
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_PARAMETER,
-            encode_func=self._protocol.encode_set_power_request,
-            encode_args={"power_dbm": power_dbm},
-            address=address
-        )
-        logger.info(f"Set power command sent successfully (Address: {address})")
+        logger.debug("Executing set power (Address: %d, Power: %d dBm)", address, power_dbm)
+        await self._execute_set_fast(self._set_table['set_power'], power_dbm, address=address)
+        logger.info("Set power command sent successfully (Address: %d)", address)
 
     async def get_power(self, address: int = 0x0000) -> int:
         """Gets the reader's transmission power."""
-        logger.debug(f"Executing get power (Address: {address})")
-        # Pass decode_func to _execute_command
-        power = await self._execute_command(
-            command_code=cph_const.CMD_QUERY_PARAMETER,
-            encode_func=self._protocol.encode_get_power_request,
-            decode_func=self._protocol.decode_get_power_response,
-            address=address
-        )
-        logger.info(f"Get power successful (Address: {address}): {power} dBm")
+        logger.debug("Executing get power (Address: %d)", address)
+        power = await self._execute_command_fast(self._cmd_table['get_power'], address=address)
+        logger.info("Get power successful (Address: %d): %s dBm", address, power)
         return power
 
     # ... (set_buzzer, get_buzzer_status, set_filter_time, get_filter_time are correct) ...
     async def set_buzzer(self, enabled: bool, address: int = 0x0000) -> None:
         """Enables or disables the reader's buzzer."""
-        logger.debug(f"Executing set buzzer (Address: {address}, Enabled: {enabled})")
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_PARAMETER,
-            encode_func=self._protocol.encode_set_buzzer_request,
-            encode_args={"enabled": enabled},
-            address=address
-        )
-        logger.info(f"Set buzzer command sent successfully (Address: {address})")
+        logger.debug("Executing set buzzer (Address: %d, Enabled: %s)", address, enabled)
+        await self._execute_set_fast(self._set_table['set_buzzer'], enabled, address=address)
+        logger.info("Set buzzer command sent successfully (Address: %d)", address)
 
     async def get_buzzer_status(self, address: int = 0x0000) -> bool:
         """Gets the status of the reader's buzzer."""
-        logger.debug(f"Executing get buzzer status (Address: {address})")
-        # Pass decode_func to _execute_command
-        status = await self._execute_command(
-            command_code=cph_const.CMD_QUERY_PARAMETER,
-            encode_func=self._protocol.encode_get_buzzer_request,
-            decode_func=self._protocol.decode_get_buzzer_response,
-            address=address
-        )
-        logger.info(f"Get buzzer status successful (Address: {address}): {status}")
+        logger.debug("Executing get buzzer status (Address: %d)", address)
+        status = await self._execute_command_fast(self._cmd_table['get_buzzer_status'], address=address)
+        logger.info("Get buzzer status successful (Address: %d): %s", address, status)
         return status
 
     async def set_filter_time(self, filter_time_ms: int, address: int = 0x0000) -> None:
         """Sets the tag filter time (in milliseconds)."""
-        logger.debug(f"Executing set filter time (Address: {address}, Time: {filter_time_ms} ms)")
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_PARAMETER,
-            encode_func=self._protocol.encode_set_filter_time_request,
-            encode_args={"filter_time_ms": filter_time_ms},
-            address=address
-        )
-        logger.info(f"Set filter time command sent successfully (Address: {address})")
+        logger.debug("Executing set filter time (Address: %d, Time: %d ms)", address, filter_time_ms)
+        await self._execute_set_fast(self._set_table['set_filter_time'], filter_time_ms, address=address)
+        logger.info("Set filter time command sent successfully (Address: %d)", address)
 
     async def get_filter_time(self, address: int = 0x0000) -> int:
         """Gets the tag filter time (in milliseconds)."""
-        logger.debug(f"Executing get filter time (Address: {address})")
-        # Pass decode_func to _execute_command
-        filter_time = await self._execute_command(
-            command_code=cph_const.CMD_QUERY_PARAMETER,
-            encode_func=self._protocol.encode_get_filter_time_request,
-            decode_func=self._protocol.decode_get_filter_time_response,
-            address=address
-        )
-        logger.info(f"Get filter time successful (Address: {address}): {filter_time} ms")
+        logger.debug("Executing get filter time (Address: %d)", address)
+        filter_time = await self._execute_command_fast(self._cmd_table['get_filter_time'], address=address)
+        logger.info("Get filter time successful (Address: %d): %s ms", address, filter_time)
         return filter_time
 
 
     # --- Tag Memory --- 
     async def read_tag_memory(self, bank: int, word_ptr: int, word_count: int, access_password: Optional[bytes] = None, address: int = 0x0000) -> bytes:
         # Already correctly uses _execute_command
-        return await self._execute_command(
+        return await self._execute_command_pos(
             command_code=cph_const.CMD_READ_TAG,
             encode_func=self._protocol.encode_read_tag_memory_request,
-            encode_args=(bank, word_ptr, word_count, access_password),
+            args=(bank, word_ptr, word_count, access_password),
             decode_func=self._protocol.decode_read_tag_memory_response,
             address=address
         )
 
+    async def read_tag_memory_batch(
+        self,
+        specs: Sequence[Tuple[int, int, int, Optional[bytes]]],
+        address: int = 0x0000,
+    ) -> List[Union[bytes, BaseException]]:
+        """
+        Reads several tag memory ranges concurrently.
+
+        Each spec is a (bank, word_ptr, word_count, access_password) tuple as
+        accepted by read_tag_memory. The reads are pipelined through the
+        dispatcher instead of awaited one at a time, so a TID + EPC + USER
+        dump pays one round-trip of latency rather than three. The CPH frame
+        carries no sequence number, but the dispatcher matches responses to
+        a shared command code FIFO, which is what makes overlapping safe.
+        At most MAX_INFLIGHT_COMMANDS requests are on the wire at once.
+
+        Results are returned in spec order. A failed read contributes its
+        exception in place of the data, so one bad spec (wrong password,
+        missing tag) does not abort the reads that succeeded.
+        """
+        async def _windowed_read(spec: Tuple[int, int, int, Optional[bytes]]) -> bytes:
+            async with self._command_window:
+                return await self.read_tag_memory(*spec, address=address)
+
+        return await asyncio.gather(
+            *(_windowed_read(spec) for spec in specs),
+            return_exceptions=True,
+        )
+
     async def write_tag(
         self,
         mem_bank: int,
         word_addr: int,
-        data: bytes,
+        data: BytesLike,
         access_password: Optional[str] = None,
         address: int = 0x0000,
     ) -> None:
         """Writes data to a tag's memory bank."""
-        logger.debug(
-            f"Executing write tag (Address: {address}, MemBank: {mem_bank}, "
-            f"WordAddr: {word_addr}, Data: {data.hex()}, "
-            f"Password: {'*' * len(access_password) if access_password else 'None'}"
-            f")"
-        )
-        await self._execute_command(
+        if logger.isEnabledFor(logging.DEBUG):
+            # Guarded: the hex dump and password mask are only worth building
+            # when debug logging is actually on.
+            logger.debug(
+                "Executing write tag (Address: %d, MemBank: %d, WordAddr: %d, "
+                "Data: %s, Password: %s)",
+                address, mem_bank, word_addr, data.hex(),
+                _mask_password(access_password)
+            )
+        await self._execute_command_kw(
             command_code=cph_const.CMD_WRITE_TAG,
             encode_func=self._protocol.encode_write_tag_request,
-            encode_args={
+            kwargs={
                 "mem_bank": mem_bank,
                 "word_addr": word_addr,
                 "data": data,
-                "access_password": access_password,
+                "access_password": _parse_password(access_password),
             },
             address=address,
         )
-        logger.info(f"Write tag command sent successfully (Address: {address})")
+        logger.info("Write tag command sent successfully (Address: %d)", address)
 
     async def lock_tag(
             self,
@@ -574,21 +779,21 @@ class Reader:
         address: int = 0x0000,
     ) -> None:
         """Locks a tag's memory banks based on the specified lock payload."""
-        logger.debug(
-            f"Executing lock tag (Address: {address}, LockPayload: {lock_payload:#06x}, "
-            f"Password: {'*' * len(access_password)}"
-            f")"
-        )
-        await self._execute_command(
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Executing lock tag (Address: %d, LockPayload: %#06x, Password: %s)",
+                address, lock_payload, _mask_password(access_password)
+            )
+        await self._execute_command_kw(
             command_code=cph_const.CMD_LOCK_TAG,
             encode_func=self._protocol.encode_lock_tag_request,
-            encode_args={
+            kwargs={
                 "lock_payload": lock_payload,
-                "access_password": access_password,
+                "access_password": _parse_password(access_password),
             },
             address=address,
         )
-        logger.info(f"Lock tag command sent successfully (Address: {address})")
+        logger.info("Lock tag command sent successfully (Address: %d)", address)
 
     async def kill_tag(self, kill_password: str) -> None:
         """Sends a command to permanently disable (kill) a tag.
@@ -607,20 +812,15 @@ class Reader:
             UhfRfidError: For other library-specific errors.
         """
         logger.warning("Attempting to send KILL TAG command - THIS IS IRREVERSIBLE!")
-        if not isinstance(kill_password, str) or len(kill_password) != 8:
-            raise ValueError("Kill password must be an 8-character hexadecimal string (4 bytes)")
-        try:
-            pwd_bytes = bytes.fromhex(kill_password)
-            if len(pwd_bytes) != 4:
-                 raise ValueError("Hex string must represent exactly 4 bytes") # Should be caught by len(kill_password) check
-        except ValueError as e:
-            raise ValueError(f"Invalid hexadecimal string for kill password: {e}") from e
+        # Single parse pass: fromhex both validates and converts.
+        pwd_bytes = _parse_password(kill_password, kind="Kill")
+        if pwd_bytes is None:
+            raise ValueError("Kill password is required")
 
-        await self._execute_command(
+        await self._execute_command_kw(
             command_code=cph_const.CMD_LOCK_TAG, # Kill uses the Lock command code
             encode_func=self._protocol.encode_kill_tag_request,
-            encode_args={"kill_password": pwd_bytes},
-            command_name="Kill Tag"
+            kwargs={"kill_password": pwd_bytes},
         )
         # No data is expected in the response for a successful kill command
         logger.info("Kill Tag command sent successfully.")
@@ -629,178 +829,81 @@ class Reader:
     async def get_rtc_time(self, address: int = 0x0000) -> datetime.datetime:
         """ Gets the reader's Real-Time Clock value. """
         # REMOVE CPH specific parsing, rely on protocol decode
-        logger.info(f"Querying RTC time from address 0x{address:04X}...")
-        # Determine encode func (might be missing in base, provide default)
-        encode_func = getattr(self._protocol, 'encode_get_rtc_request', lambda: b'')
-        
-        return await self._execute_command(
-            command_code=cph_const.CMD_QUERY_RTC_TIME,
-            encode_func=encode_func,
-            decode_func=self._protocol.decode_get_rtc_response,
-            address=address
-        )
+        logger.info("Querying RTC time from address 0x%04X...", address)
+        return await self._execute_command_fast(self._cmd_table['get_rtc_time'], address=address)
 
     async def set_rtc_time(self, time_to_set: datetime.datetime, address: int = 0x0000) -> None:
         # Already correctly uses _execute_command
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_RTC_TIME,
-            encode_func=self._protocol.encode_set_rtc_request,
-            encode_args=(time_to_set,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['set_rtc_time'], time_to_set, address=address)
 
     # --- Complex Parameter Sets --- 
     # ... (get/set methods for ExtParams, WorkingParams, etc. are correct) ...
     async def get_ext_params(self, address: int = 0x0000) -> ExtParams:
-        encode_func = getattr(self._protocol, 'encode_get_ext_params_request', lambda: b'')
-        return await self._execute_command(
-            command_code=cph_const.CMD_QUERY_EXT_PARAM,
-            encode_func=encode_func,
-            decode_func=self._protocol.decode_get_ext_params_response,
-            address=address
-        )
+        return await self._execute_command_fast(self._cmd_table['get_ext_params'], address=address)
 
     async def set_ext_params(self, params: ExtParams, address: int = 0x0000) -> None:
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_EXT_PARAM,
-            encode_func=self._protocol.encode_set_ext_params_request,
-            encode_args=(params,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['set_ext_params'], params, address=address)
 
     async def get_working_params(self, address: int = 0x0000) -> WorkingParams:
-        encode_func = getattr(self._protocol, 'encode_get_working_params_request', lambda: b'')
-        return await self._execute_command(
-            command_code=cph_const.CMD_QUERY_WORKING_PARAM,
-            encode_func=encode_func,
-            decode_func=self._protocol.decode_get_working_params_response,
-            address=address
-        )
+        return await self._execute_command_fast(self._cmd_table['get_working_params'], address=address)
 
     async def set_working_params(self, params: WorkingParams, address: int = 0x0000) -> None:
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_WORKING_PARAM,
-            encode_func=self._protocol.encode_set_working_params_request,
-            encode_args=(params,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['set_working_params'], params, address=address)
 
     async def get_transport_params(self, address: int = 0x0000) -> TransportParams:
-        encode_func = getattr(self._protocol, 'encode_get_transport_params_request', lambda: b'')
-        return await self._execute_command(
-            command_code=cph_const.CMD_QUERY_TRANSPORT_PARAM,
-            encode_func=encode_func,
-            decode_func=self._protocol.decode_get_transport_params_response,
-            address=address
-        )
+        return await self._execute_command_fast(self._cmd_table['get_transport_params'], address=address)
 
     async def set_transport_params(self, params: TransportParams, address: int = 0x0000) -> None:
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_TRANSPORT_PARAM,
-            encode_func=self._protocol.encode_set_transport_params_request,
-            encode_args=(params,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['set_transport_params'], params, address=address)
 
     async def get_advance_params(self, address: int = 0x0000) -> AdvanceParams:
-        encode_func = getattr(self._protocol, 'encode_get_advance_params_request', lambda: b'')
-        return await self._execute_command(
-            command_code=cph_const.CMD_QUERY_ADVANCE_PARAM,
-            encode_func=encode_func,
-            decode_func=self._protocol.decode_get_advance_params_response,
-            address=address
-        )
+        return await self._execute_command_fast(self._cmd_table['get_advance_params'], address=address)
 
     async def set_advance_params(self, params: AdvanceParams, address: int = 0x0000) -> None:
-        await self._execute_command(
-            command_code=cph_const.CMD_SET_ADVANCE_PARAM,
-            encode_func=self._protocol.encode_set_advance_params_request,
-            encode_args=(params,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['set_advance_params'], params, address=address)
 
     async def get_usb_data_params(self, address: int = 0x0000) -> UsbDataParams:
-         encode_func = getattr(self._protocol, 'encode_get_usb_data_params_request', lambda: b'')
-         return await self._execute_command(
-             command_code=cph_const.CMD_QUERY_USB_DATA,
-             encode_func=encode_func,
-             decode_func=self._protocol.decode_get_usb_data_params_response,
-             address=address
-         )
+         return await self._execute_command_fast(self._cmd_table['get_usb_data_params'], address=address)
 
     async def set_usb_data_params(self, params: UsbDataParams, address: int = 0x0000) -> None:
-         await self._execute_command(
-             command_code=cph_const.CMD_SET_USB_DATA,
-             encode_func=self._protocol.encode_set_usb_data_params_request,
-             encode_args=(params,),
-             decode_func=None,
-             address=address
-         )
+         await self._execute_set_fast(self._set_table['set_usb_data_params'], params, address=address)
 
     async def get_data_flag_params(self, address: int = 0x0000) -> DataFlagParams:
-         encode_func = getattr(self._protocol, 'encode_get_data_flag_params_request', lambda: b'')
-         return await self._execute_command(
-             command_code=cph_const.CMD_QUERY_DATA_FLAG,
-             encode_func=encode_func,
-             decode_func=self._protocol.decode_get_data_flag_params_response,
-             address=address
-         )
+         return await self._execute_command_fast(self._cmd_table['get_data_flag_params'], address=address)
 
     async def set_data_flag_params(self, params: DataFlagParams, address: int = 0x0000) -> None:
-         await self._execute_command(
-             command_code=cph_const.CMD_SET_DATA_FLAG,
-             encode_func=self._protocol.encode_set_data_flag_params_request,
-             encode_args=(params,),
-             decode_func=None,
-             address=address
-         )
+         await self._execute_set_fast(self._set_table['set_data_flag_params'], params, address=address)
 
     async def get_modbus_params(self, address: int = 0x0000) -> ModbusParams:
-         encode_func = getattr(self._protocol, 'encode_get_modbus_params_request', lambda: b'')
-         return await self._execute_command(
-             command_code=cph_const.CMD_QUERY_MODBUS_PARAM,
-             encode_func=encode_func,
-             decode_func=self._protocol.decode_get_modbus_params_response,
-             address=address
-         )
+         return await self._execute_command_fast(self._cmd_table['get_modbus_params'], address=address)
 
     async def set_modbus_params(self, params: ModbusParams, address: int = 0x0000) -> None:
-         await self._execute_command(
-             command_code=cph_const.CMD_SET_MODBUS_PARAM,
-             encode_func=self._protocol.encode_set_modbus_params_request,
-             encode_args=(params,),
-             decode_func=None,
-             address=address
-         )
+         await self._execute_set_fast(self._set_table['set_modbus_params'], params, address=address)
 
     # --- Misc Commands --- 
     # ... (relay_operation, play_audio are correct) ...
     async def relay_operation(self, relay_state: int, address: int = 0x0000) -> None:
-        await self._execute_command(
-            command_code=cph_const.CMD_RELAY_OP,
-            encode_func=self._protocol.encode_relay_op_request,
-            encode_args=(relay_state,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['relay_operation'], relay_state, address=address)
+
+    async def play_audio(self, audio_data: Union[str, BytesLike], encoding: str = 'utf-8', address: int = 0x0000) -> None:
+        """Plays audio given as text or pre-encoded bytes.
 
-    async def play_audio(self, audio_data: Union[str, bytes], encoding: str = 'utf-8', address: int = 0x0000) -> None:
+        Polymorphic convenience entry; callers that already know their input
+        type can use play_audio_bytes / play_audio_text directly.
+        """
         if isinstance(audio_data, str):
              payload = audio_data.encode(encoding)
         else:
              payload = audio_data
-        await self._execute_command(
-            command_code=cph_const.CMD_AUDIO_PLAY,
-            encode_func=self._protocol.encode_audio_play_request,
-            encode_args=(payload,),
-            decode_func=None,
-            address=address
-        )
+        await self._execute_set_fast(self._set_table['play_audio'], payload, address=address)
+
+    async def play_audio_bytes(self, payload: BytesLike, address: int = 0x0000) -> None:
+        """Plays pre-encoded audio bytes, skipping play_audio's type dispatch."""
+        await self._execute_set_fast(self._set_table['play_audio'], payload, address=address)
+
+    async def play_audio_text(self, text: str, encoding: str = 'utf-8', address: int = 0x0000) -> None:
+        """Encodes 'text' with 'encoding' and plays it."""
+        await self._execute_set_fast(self._set_table['play_audio'], text.encode(encoding), address=address)
 
     # --- Tag Operations ---
 
@@ -813,26 +916,28 @@ class Reader:
         address: int = 0x0000,
     ) -> bytes:
         """Reads data from a tag's memory bank."""
-        logger.debug(
-            f"Executing read tag (Address: {address}, MemBank: {mem_bank}, "
-            f"WordAddr: {word_addr}, WordCount: {word_count}, "
-            f"Password: {'*' * len(access_password) if access_password else 'None'}"
-            f")"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Executing read tag (Address: %d, MemBank: %d, WordAddr: %d, "
+                "WordCount: %d, Password: %s)",
+                address, mem_bank, word_addr, word_count,
+                _mask_password(access_password)
+            )
         # Pass decode_func to _execute_command
-        tag_data = await self._execute_command(
+        tag_data = await self._execute_command_kw(
             command_code=cph_const.CMD_READ_TAG,
             encode_func=self._protocol.encode_read_tag_request,
-            encode_args={
+            kwargs={
                 "mem_bank": mem_bank,
                 "word_addr": word_addr,
                 "word_count": word_count,
-                "access_password": access_password,
+                "access_password": _parse_password(access_password),
             },
             decode_func=self._protocol.decode_read_tag_response,
             address=address,
         )
-        logger.info(f"Read tag successful (Address: {address}): {tag_data.hex()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Read tag successful (Address: %d): %s", address, tag_data.hex())
         return tag_data
 
     # --- Context Manager --- 
@@ -11,5 +11,14 @@ class ConnectionStatus(Enum):
     ERROR = auto() # Indicates an unrecoverable error state
 
     def __str__(self):
-        # Provide a user-friendly string representation
-        return self.name
+        # Provide a user-friendly string representation. _str_cache is set
+        # once below; self.name would re-run the enum's DynamicClassAttribute
+        # descriptor on every log-format call.
+        return self._str_cache
+
+
+# Cache each member's name as a plain instance attribute so __str__ is a
+# direct slot-less attribute read instead of a descriptor dispatch.
+for _member in ConnectionStatus:
+    _member._str_cache = _member.name
+del _member
@@ -1,5 +1,33 @@
 """Protocol implementations for UHF RFID library."""
 
-from .registry import ProtocolRegistry
+import importlib
 
-__all__ = ['ProtocolRegistry'] 
\ No newline at end of file
+# Loaded lazily (PEP 562): importing leaf modules such as .framing or
+# .cph.constants must not execute the registry (which instantiates the full
+# protocol import chain).
+_LAZY = {
+    'register_protocol': '.registry',
+    'get_protocol_class': '.registry',
+    'create_protocol': '.registry',
+    'list_protocols': '.registry',
+    'get_installed_protocols': '.registry',
+}
+
+__all__ = [
+    'register_protocol',
+    'get_protocol_class',
+    'create_protocol',
+    'list_protocols',
+    'get_installed_protocols',
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
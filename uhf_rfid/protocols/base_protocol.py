@@ -4,7 +4,6 @@ import datetime
 from typing import Any, Coroutine, Dict, Tuple, Optional, Union, List
 
 # Define common data structures (може да се изнесат в uhf_rfid/common/ R later)
-from dataclasses import dataclass
 
 # Import parameter dataclasses - assuming they exist here
 # If not, adjust the import path
@@ -35,24 +34,66 @@ RELAY_OFF = 0x00
 RELAY_ON = 0x01
 RELAY_PULSE = 0x02
 
-@dataclass
+# Payload inputs only need the buffer protocol, not bytes specifically:
+# accepting bytearray/memoryview lets callers pass externally-owned buffers
+# (e.g. audio data from an mmap) without copying them first.
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Plain __slots__ classes rather than dataclasses: @dataclass(slots=True)
+# needs Python 3.10 and this package supports 3.8, while a frozen dataclass
+# would slow construction (object.__setattr__ per field) on the per-tag hot
+# path. Slots drop the per-instance __dict__, which matters when inventory
+# streams produce thousands of TagReadData objects per second.
+
 class DeviceInfo:
     # Примерна структура, може да се разшири
-    software_version: str = "N/A"
-    hardware_version: str = "N/A"
-    manufacturer: str = "N/A"
-    model: str = "N/A"
-    serial_number: str = "N/A"
+    __slots__ = ('software_version', 'hardware_version', 'manufacturer', 'model', 'serial_number')
+
+    def __init__(self, software_version: str = "N/A", hardware_version: str = "N/A",
+                 manufacturer: str = "N/A", model: str = "N/A", serial_number: str = "N/A"):
+        self.software_version = software_version
+        self.hardware_version = hardware_version
+        self.manufacturer = manufacturer
+        self.model = model
+        self.serial_number = serial_number
+
+    def __repr__(self) -> str:
+        return (f"DeviceInfo(software_version={self.software_version!r}, "
+                f"hardware_version={self.hardware_version!r}, manufacturer={self.manufacturer!r}, "
+                f"model={self.model!r}, serial_number={self.serial_number!r})")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DeviceInfo):
+            return NotImplemented
+        return (self.software_version, self.hardware_version, self.manufacturer,
+                self.model, self.serial_number) == \
+               (other.software_version, other.hardware_version, other.manufacturer,
+                other.model, other.serial_number)
+
 
-@dataclass
 class TagReadData:
      # Примерна структура
-     epc: str
-     tid: Optional[str] = None
-     user_data: Optional[bytes] = None
-     rssi: Optional[int] = None
-     antenna: Optional[int] = None
-     timestamp: Optional[datetime.datetime] = None
+     __slots__ = ('epc', 'tid', 'user_data', 'rssi', 'antenna', 'timestamp')
+
+     def __init__(self, epc: str, tid: Optional[str] = None, user_data: Optional[bytes] = None,
+                  rssi: Optional[int] = None, antenna: Optional[int] = None,
+                  timestamp: Optional[datetime.datetime] = None):
+         self.epc = epc
+         self.tid = tid
+         self.user_data = user_data
+         self.rssi = rssi
+         self.antenna = antenna
+         self.timestamp = timestamp
+
+     def __repr__(self) -> str:
+         return (f"TagReadData(epc={self.epc!r}, tid={self.tid!r}, user_data={self.user_data!r}, "
+                 f"rssi={self.rssi!r}, antenna={self.antenna!r}, timestamp={self.timestamp!r})")
+
+     def __eq__(self, other: object) -> bool:
+         if not isinstance(other, TagReadData):
+             return NotImplemented
+         return (self.epc, self.tid, self.user_data, self.rssi, self.antenna, self.timestamp) == \
+                (other.epc, other.tid, other.user_data, other.rssi, other.antenna, other.timestamp)
 
 
 class BaseProtocol(abc.ABC):
@@ -149,7 +190,7 @@ class BaseProtocol(abc.ABC):
         """ Decodes the read data from parsed response parameters. """
         raise NotImplementedError
 
-    def encode_write_tag_memory_request(self, bank: int, word_ptr: int, data: bytes, password: bytes) -> bytes:
+    def encode_write_tag_memory_request(self, bank: int, word_ptr: int, data: BytesLike, password: bytes) -> bytes:
         """ Encodes the write tag memory request parameters. """
         raise NotImplementedError
 
@@ -275,7 +316,7 @@ class BaseProtocol(abc.ABC):
         """ Encodes parameters to control the relay. `relay_state` is protocol specific. """
         raise NotImplementedError
 
-    def encode_audio_play_request(self, audio_data: bytes) -> bytes:
+    def encode_audio_play_request(self, audio_data: BytesLike) -> bytes:
         """ Encodes parameters to play audio (e.g., text or sound index). """
         raise NotImplementedError
 
@@ -1,5 +1,23 @@
 """CPH Protocol Implementation."""
 
-from .protocol import CPHProtocol
+import importlib
 
-__all__ = ['CPHProtocol'] 
\ No newline at end of file
+# Loaded lazily (PEP 562) so that importing submodules such as
+# uhf_rfid.protocols.cph.parameters or .constants does not execute the full
+# protocol implementation (which itself depends on base_protocol).
+_LAZY = {
+    'CPHProtocol': '.protocol',
+}
+
+__all__ = ['CPHProtocol']
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,7 @@
 # uhf_rfid/protocols/cph/commands_device.py
 import datetime
 import logging
+import struct
 from typing import Dict, Any
 
 # Use absolute imports
@@ -11,6 +12,9 @@ from uhf_rfid.core.exceptions import ProtocolError
 
 logger = logging.getLogger(__name__)
 
+# CPH 7-byte RTC layout: year (big-endian u16) + month/day/hour/minute/second.
+_RTC_STRUCT = struct.Struct('>H5B')
+
 def encode_reboot_request() -> bytes:
     # Reboot command typically has no parameters
     return b''
@@ -38,20 +42,16 @@ def encode_set_rtc_request(time_to_set: datetime.datetime) -> bytes:
         if not (2000 <= time_to_set.year <= 9999): # Example validation
              raise ValueError(f"Year {time_to_set.year} out of typical CPH range")
 
-        year_high = (time_to_set.year >> 8) & 0xFF
-        year_low = time_to_set.year & 0xFF
-        time_bytes = bytes([
-            year_high, year_low,
+        time_bytes = _RTC_STRUCT.pack(
+            time_to_set.year,
             time_to_set.month, time_to_set.day,
             time_to_set.hour, time_to_set.minute, time_to_set.second
-        ])
+        )
         return tlv.build_tlv(cph_const.TAG_TIME, time_bytes)
-    except (ValueError, TypeError) as e:
+    except (ValueError, TypeError, AttributeError, struct.error) as e:
+        # AttributeError covers non-datetime inputs missing .year/.month/...
         logger.error(f"Error encoding RTC time {time_to_set}: {e}")
         raise ProtocolError(f"Invalid datetime object for CPH encoding: {e}") from e
-    except Exception as e:
-         logger.exception(f"Unexpected error encoding RTC time: {e}")
-         raise ProtocolError(f"Unexpected error encoding RTC time: {e}") from e
 
 def decode_get_rtc_response(parsed_params: Dict[Any, Any]) -> datetime.datetime:
     """ Decodes CPH 7-byte format from TAG_TIME TLV in parsed response. """
@@ -63,17 +63,10 @@ def decode_get_rtc_response(parsed_params: Dict[Any, Any]) -> datetime.datetime:
         raise ProtocolError(f"Invalid RTC time data format: Expected 7 bytes, got {time_data!r}")
 
     try:
-        year_high, year_low, month, day, hour, minute, second = time_data
-        year = (year_high << 8) | year_low
-
-        # Perform basic validation on decoded values
-        if not (1 <= month <= 12 and 1 <= day <= 31 and 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
-            raise ValueError(f"Invalid date/time values decoded: Y={year}, M={month}, D={day}, H={hour}, M={minute}, S={second}")
-
+        year, month, day, hour, minute, second = _RTC_STRUCT.unpack(time_data)
+        # No manual range checks: the datetime constructor validates every
+        # field in C (including days-per-month) and raises ValueError.
         return datetime.datetime(year, month, day, hour, minute, second)
     except ValueError as e:
         logger.error(f"Error parsing RTC time data ({time_data.hex(' ')}): {e}")
-        raise ProtocolError(f"Error parsing RTC time data: {e}") from e
-    except Exception as e:
-         logger.exception(f"Unexpected error parsing RTC time data: {e}")
-         raise ProtocolError(f"Unexpected error parsing RTC time data: {e}") from e 
\ No newline at end of file
+        raise ProtocolError(f"Error parsing RTC time data: {e}") from e 
\ No newline at end of file
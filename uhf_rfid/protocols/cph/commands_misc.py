@@ -1,73 +1,90 @@
 # uhf_rfid/protocols/cph/commands_misc.py
 import logging
+import struct
 from typing import Dict, Any, Union
 
 # Use absolute imports
 from uhf_rfid.protocols.cph import constants as cph_const
 from uhf_rfid.protocols.cph import tlv
 from uhf_rfid.core.exceptions import ProtocolError
+from ..base_protocol import BytesLike
 from .parameters import ModbusParams, UsbDataParams, DataFlagParams # Import needed dataclasses
 
 logger = logging.getLogger(__name__)
 
-# --- Relay --- 
+# --- Relay ---
+# Only three valid states exist, so the complete TLVs are prebuilt: lookup
+# both validates the state and returns the encoding in one dict probe.
+_RELAY_TLV = {
+    state: tlv.build_tlv(cph_const.TAG_RELAY, bytes((state,)))
+    for state in (cph_const.RELAY_OFF, cph_const.RELAY_ON, cph_const.RELAY_PULSE)
+}
+
 def encode_relay_op_request(relay_state: int) -> bytes:
     """ Encodes request parameters for CMD_RELAY_OP (0x4C) using TAG_RELAY (0x27). """
-    # Validate relay_state against known constants
-    if relay_state not in [cph_const.RELAY_OFF, cph_const.RELAY_ON, cph_const.RELAY_PULSE]:
+    try:
+        encoded = _RELAY_TLV[relay_state]
+    except (KeyError, TypeError):
         logger.error(f"Invalid relay state provided: {relay_state}")
-        raise ValueError(f"Invalid relay state: {relay_state}. Must be RELAY_OFF(0), RELAY_ON(1), or RELAY_PULSE(2).")
-    logger.info(f"Encoding Relay Op: State={relay_state}")
-    # TAG_RELAY expects 1 byte value
-    return tlv.build_tlv(cph_const.TAG_RELAY, bytes([relay_state]))
+        raise ValueError(f"Invalid relay state: {relay_state}. Must be RELAY_OFF(0), RELAY_ON(1), or RELAY_PULSE(2).") from None
+    logger.debug("Encoding Relay Op: State=%d", relay_state)
+    return encoded
 
 # --- Audio --- 
-def encode_audio_play_request(audio_data: bytes) -> bytes:
+def encode_audio_play_request(audio_data: BytesLike) -> bytes:
     """ Encodes request parameters for CMD_AUDIO_PLAY (0x4D) using TAG_AUDIO_TEXT (0x28). """
     # The command expects the audio data (e.g., text encoded in UTF-8 or GBK, or an index)
     # directly as the value of TAG_AUDIO_TEXT.
     if not audio_data:
         raise ValueError("Audio data cannot be empty")
-    logger.info(f"Encoding Audio Play: DataLen={len(audio_data)}")
+    logger.info("Encoding Audio Play: DataLen=%d", len(audio_data))
     return tlv.build_tlv(cph_const.TAG_AUDIO_TEXT, audio_data)
 
-# --- Modbus --- 
+# --- Modbus ---
+# Module-local bindings of the canonical constants.py tags (one global load
+# per use in the encoder below).
+TAG_MODBUS_ADDRESS = cph_const.TAG_MODBUS_ADDRESS
+TAG_BAUD_RATE = cph_const.TAG_BAUD_RATE
+TAG_MODBUS_PARITY = cph_const.TAG_MODBUS_PARITY
+TAG_MODBUS_STOP_BITS = cph_const.TAG_MODBUS_STOP_BITS
+TAG_MODBUS_PROTOCOL = cph_const.TAG_MODBUS_PROTOCOL
+
+# Pre-bound packer/unpacker for the 4-byte baud-rate code: cheaper than
+# int.to_bytes / int.from_bytes with their per-call byteorder handling.
+_U32_BE = struct.Struct('>I')
+_PACK_U32_INTO = _U32_BE.pack_into
+_UNPACK_U32_BE = _U32_BE.unpack
+
+# Tags that must all be present in a query-Modbus-params response.
+_REQUIRED_MODBUS_TAGS = frozenset((TAG_MODBUS_ADDRESS, TAG_BAUD_RATE, TAG_MODBUS_PARITY, TAG_MODBUS_STOP_BITS))
+
 def encode_set_modbus_params_request(params: ModbusParams) -> bytes:
     """ Encodes request parameters for CMD_SET_MODBUS_PARAM (0x54). """
     # This command uses multiple individual TLVs according to CPH v4.0.1 spec.
-    # Define the required TAG constants if they are missing from constants.py
-    TAG_MODBUS_ADDRESS = 0x53 # Spec v4.0.1 Doc (Confirm this) - Reader code used 0x01? No, 0x53 seems right.
-    TAG_BAUD_RATE = 0x0B # Spec v4.0.1 Doc (Confirm this)
-    TAG_MODBUS_PARITY = 0x54 # Spec v4.0.1 Doc (Confirm this)
-    TAG_MODBUS_STOP_BITS = 0x55 # Spec v4.0.1 Doc (Confirm this)
-    TAG_MODBUS_PROTOCOL = 0x56 # Spec v4.0.1 Doc (Optional)
-
-    logger.info(f"Encoding Set Modbus Params: Addr={params.address}, Baud={params.baud_rate_code}, Parity={params.parity_code}, Stop={params.stop_bits_code}, Proto={params.protocol_code}")
+    logger.info("Encoding Set Modbus Params: Addr=%s, Baud=%s, Parity=%s, Stop=%s, Proto=%s",
+                params.address, params.baud_rate_code, params.parity_code, params.stop_bits_code, params.protocol_code)
     try:
-        tlv_list = []
         # Address (1 byte)
         if not (0 <= params.address <= 255):
             raise ValueError(f"Invalid Modbus Address: {params.address}")
-        tlv_list.append(tlv.build_tlv(TAG_MODBUS_ADDRESS, params.address.to_bytes(1, 'big')))
-
+        proto = params.protocol_code
+        # Every sub-TLV has a fixed width, so the whole payload is written
+        # into one pre-sized buffer: addr(3) + baud(6) + parity(3) + stop(3)
+        # [+ protocol(3)]. Byte assignment range-checks each code (0-255)
+        # with the same ValueError the per-field encodes raised.
+        buf = bytearray(15 if proto is None else 18)
+        buf[0] = TAG_MODBUS_ADDRESS; buf[1] = 1; buf[2] = params.address
         # Baud Rate (4 bytes - likely index/code, not actual rate)
-        # Assuming the code fits in 4 bytes. Need to validate range if known.
-        tlv_list.append(tlv.build_tlv(TAG_BAUD_RATE, params.baud_rate_code.to_bytes(4, 'big')))
-
-        # Parity (1 byte code)
-        # Validate parity code if known values exist
-        tlv_list.append(tlv.build_tlv(TAG_MODBUS_PARITY, params.parity_code.to_bytes(1, 'big')))
-
-        # Stop Bits (1 byte code)
-        # Validate stop bits code if known values exist
-        tlv_list.append(tlv.build_tlv(TAG_MODBUS_STOP_BITS, params.stop_bits_code.to_bytes(1, 'big')))
-
+        buf[3] = TAG_BAUD_RATE; buf[4] = 4
+        _PACK_U32_INTO(buf, 5, params.baud_rate_code)
+        # Parity (1 byte code). Validate parity code if known values exist
+        buf[9] = TAG_MODBUS_PARITY; buf[10] = 1; buf[11] = params.parity_code
+        # Stop Bits (1 byte code). Validate stop bits code if known values exist
+        buf[12] = TAG_MODBUS_STOP_BITS; buf[13] = 1; buf[14] = params.stop_bits_code
         # Protocol (1 byte code, optional)
-        if params.protocol_code is not None:
-             # Validate protocol code if known values exist
-             tlv_list.append(tlv.build_tlv(TAG_MODBUS_PROTOCOL, params.protocol_code.to_bytes(1, 'big')))
-
-        return b''.join(tlv_list)
+        if proto is not None:
+             buf[15] = TAG_MODBUS_PROTOCOL; buf[16] = 1; buf[17] = proto
+        return bytes(buf)
     except ValueError as e:
          logger.error(f"Invalid Modbus parameter value: {e}")
          raise ProtocolError(f"Invalid Modbus parameter value: {e}") from e
@@ -77,20 +94,14 @@ def encode_set_modbus_params_request(params: ModbusParams) -> bytes:
 
 def decode_get_modbus_params_response(parsed_params: Dict[Any, Any]) -> ModbusParams:
     """ Decodes response parameters for CMD_QUERY_MODBUS_PARAM (0x55). """
-    # Response contains multiple individual TLVs.
-    TAG_MODBUS_ADDRESS = 0x53
-    TAG_BAUD_RATE = 0x0B
-    TAG_MODBUS_PARITY = 0x54
-    TAG_MODBUS_STOP_BITS = 0x55
-    TAG_MODBUS_PROTOCOL = 0x56 # Optional
-
-    logger.debug(f"Decoding Get Modbus Params response: {parsed_params}")
+    # Response contains multiple individual TLVs (module-level TAG constants).
+    logger.debug("Decoding Get Modbus Params response: %s", parsed_params)
     try:
-        # Check required tags exist
-        required_tags = [TAG_MODBUS_ADDRESS, TAG_BAUD_RATE, TAG_MODBUS_PARITY, TAG_MODBUS_STOP_BITS]
-        for tag in required_tags:
-            if tag not in parsed_params:
-                raise ProtocolError(f"Missing required Modbus parameter tag 0x{tag:02X} in response", frame_part=parsed_params)
+        # One C-level set difference instead of per-tag membership tests
+        missing = _REQUIRED_MODBUS_TAGS.difference(parsed_params)
+        if missing:
+            missing_hex = ', '.join(f"0x{tag:02X}" for tag in sorted(missing))
+            raise ProtocolError(f"Missing required Modbus parameter tag(s) {missing_hex} in response", frame_part=parsed_params)
 
         # Extract values (assuming tlv parser returns bytes)
         addr_bytes = parsed_params[TAG_MODBUS_ADDRESS]
@@ -104,16 +115,18 @@ def decode_get_modbus_params_response(parsed_params: Dict[Any, Any]) -> ModbusPa
         if len(parity_bytes) != 1: raise ValueError(f"Invalid length for Parity TLV: {len(parity_bytes)}")
         if len(stop_bytes) != 1: raise ValueError(f"Invalid length for Stop Bits TLV: {len(stop_bytes)}")
 
-        addr = int.from_bytes(addr_bytes, 'big')
-        baud_code = int.from_bytes(baud_bytes, 'big')
-        parity_code = int.from_bytes(parity_bytes, 'big')
-        stop_code = int.from_bytes(stop_bytes, 'big')
+        # Single-byte fields index directly; the 4-byte baud code goes through
+        # the pre-bound struct unpacker.
+        addr = addr_bytes[0]
+        baud_code = _UNPACK_U32_BE(baud_bytes)[0]
+        parity_code = parity_bytes[0]
+        stop_code = stop_bytes[0]
 
         proto_code = None
         if TAG_MODBUS_PROTOCOL in parsed_params:
              proto_bytes = parsed_params[TAG_MODBUS_PROTOCOL]
              if len(proto_bytes) == 1:
-                  proto_code = int.from_bytes(proto_bytes, 'big')
+                  proto_code = proto_bytes[0]
              else:
                   logger.warning(f"Invalid length for optional Modbus Protocol TLV: {len(proto_bytes)}, ignoring.")
 
@@ -126,40 +139,25 @@ def decode_get_modbus_params_response(parsed_params: Dict[Any, Any]) -> ModbusPa
         logger.exception(f"Unexpected error parsing Modbus Parameters data: {e}")
         raise ProtocolError(f"Unexpected error parsing Modbus Parameters data: {e}", frame_part=parsed_params) from e
 
-# --- USB Data / Data Flag --- 
-# Implement encode/decode functions for UsbDataParams and DataFlagParams
-# These will likely require specific TAG constants from CPH spec.
+# --- USB Data / Data Flag ---
+# Placeholders until the CPH spec's wrapper TAG constants are confirmed:
+# each body is a bare raise so the unimplemented state costs nothing beyond
+# the exception itself (no per-call warning, no speculative dead code).
 
 def encode_set_usb_data_params_request(params: UsbDataParams) -> bytes:
-    # Placeholder - Needs specific TAG from CPH Spec for CMD_SET_USB_DATA (0x50)
-    logger.warning("encode_set_usb_data_params_request not fully implemented - requires TAG definition.")
-    # Assuming a wrapper TAG, e.g., TAG_USB_DATA_PARAM = 0x??
-    # encoded_data = params.encode()
-    # return tlv.build_tlv(cph_const.TAG_USB_DATA_PARAM, encoded_data)
+    # Needs specific TAG from CPH Spec for CMD_SET_USB_DATA (0x50)
     raise NotImplementedError("TAG for USB Data Params not defined/implemented")
 
 def decode_get_usb_data_params_response(parsed_params: Dict[Any, Any]) -> UsbDataParams:
-    # Placeholder - Needs specific TAG from CPH Spec for CMD_QUERY_USB_DATA (0x51) response
-    logger.warning("decode_get_usb_data_params_response not fully implemented - requires TAG definition.")
-    # Assuming a wrapper TAG, e.g., TAG_USB_DATA_PARAM = 0x??
-    # param_data = parsed_params[cph_const.TAG_USB_DATA_PARAM]
-    # return UsbDataParams.decode(param_data)
+    # Needs specific TAG from CPH Spec for CMD_QUERY_USB_DATA (0x51) response
     raise NotImplementedError("TAG for USB Data Params not defined/implemented")
 
 def encode_set_data_flag_params_request(params: DataFlagParams) -> bytes:
-    # Placeholder - Needs specific TAG from CPH Spec for CMD_SET_DATA_FLAG (0x52)
-    logger.warning("encode_set_data_flag_params_request not fully implemented - requires TAG definition.")
-    # Assuming a wrapper TAG, e.g., TAG_DATA_FLAG_PARAM = 0x??
-    # encoded_data = params.encode()
-    # return tlv.build_tlv(cph_const.TAG_DATA_FLAG_PARAM, encoded_data)
+    # Needs specific TAG from CPH Spec for CMD_SET_DATA_FLAG (0x52)
     raise NotImplementedError("TAG for Data Flag Params not defined/implemented")
 
 def decode_get_data_flag_params_response(parsed_params: Dict[Any, Any]) -> DataFlagParams:
-    # Placeholder - Needs specific TAG from CPH Spec for CMD_QUERY_DATA_FLAG (0x53) response
-    logger.warning("decode_get_data_flag_params_response not fully implemented - requires TAG definition.")
-    # Assuming a wrapper TAG, e.g., TAG_DATA_FLAG_PARAM = 0x??
-    # param_data = parsed_params[cph_const.TAG_DATA_FLAG_PARAM]
-    # return DataFlagParams.decode(param_data)
+    # Needs specific TAG from CPH Spec for CMD_QUERY_DATA_FLAG (0x53) response
     raise NotImplementedError("TAG for Data Flag Params not defined/implemented")
 
 # --- Other Misc Commands --- 
@@ -6,7 +6,7 @@ from typing import Dict, Any, Optional, Union
 from uhf_rfid.protocols.cph import constants as cph_const
 from uhf_rfid.protocols.cph import tlv
 from uhf_rfid.core.exceptions import ProtocolError, TLVParseError
-from uhf_rfid.protocols.base_protocol import TagReadData
+from uhf_rfid.protocols.base_protocol import BytesLike, TagReadData
 
 # Constants needed for tag operations (import directly or reference via cph_const)
 MEM_BANK_RESERVED = cph_const.MEM_BANK_RESERVED
@@ -46,7 +46,7 @@ def encode_stop_inventory_request() -> bytes:
 
 # --- Tag Memory Access --- 
 
-def _encode_tag_operation_tlv(op_type: int, bank: int, word_ptr: int, word_count: int, password: Optional[bytes], data: Optional[bytes]) -> bytes:
+def _encode_tag_operation_tlv(op_type: int, bank: int, word_ptr: int, word_count: int, password: Optional[BytesLike], data: Optional[BytesLike]) -> bytes:
     """ Helper to build the Operation TLV (TAG_OPERATION 0x08). """
     # Validate inputs
     if bank not in [MEM_BANK_RESERVED, MEM_BANK_EPC, MEM_BANK_TID, MEM_BANK_USER]:
@@ -137,7 +137,7 @@ def decode_read_tag_memory_response(parsed_params: Dict[Any, Any]) -> bytes:
     logger.error(f"Could not find expected data TLV (TAG_USER_DATA, TAG_EPC, TAG_TID_DATA, or TAG_RESERVE_DATA) in read tag response. Params: {parsed_params}")
     raise ProtocolError("Could not find read tag data in response", frame_part=parsed_params)
 
-def encode_write_tag_memory_request(bank: int, word_ptr: int, data: bytes, password: Optional[bytes] = None) -> bytes:
+def encode_write_tag_memory_request(bank: int, word_ptr: int, data: BytesLike, password: Optional[bytes] = None) -> bytes:
     """ Encodes request parameters for CMD_WRITE_TAG (0x30) using Operation TLV. """
     if not data:
         raise ValueError("Data cannot be empty for write operation")
@@ -174,7 +174,7 @@ def encode_lock_tag_request(lock_type: int, password: Optional[bytes] = None) ->
         raise ProtocolError(f"Invalid password for lock tag: {e}") from e
 
 # --- Tag Kill --- 
-def encode_kill_tag_request(kill_password: bytes) -> bytes:
+def encode_kill_tag_request(kill_password: BytesLike) -> bytes:
     """ Encodes request parameters for CMD_LOCK_TAG (0x33) used for KILL operation. """
     # Kill uses TAG_OPERATION (0x08) TLV
     # op_type = OP_TYPE_KILL (0x03)
@@ -88,6 +88,12 @@ TAG_AUDIO_TEXT: int = 0x28 # New
 TAG_EXT_PARAM: int = 0x29 # New
 TAG_SINGLE_TAG: int = 0x50 # Container for nested tag data
 TAG_DEVICE_NO: int = 0x52 # <<< NEW (Device Number)
+# Modbus sub-parameter tags (CPH v4.0.1 spec, used by CMD_SET/QUERY_MODBUS_PARAM)
+TAG_MODBUS_ADDRESS: int = 0x53
+TAG_BAUD_RATE: int = 0x0B
+TAG_MODBUS_PARITY: int = 0x54
+TAG_MODBUS_STOP_BITS: int = 0x55
+TAG_MODBUS_PROTOCOL: int = 0x56 # Optional
 TAG_TEMPERATURE: int = 0x70 # New
 
 # --- Memory Bank Constants (for Operation TLV) ---
@@ -6,7 +6,7 @@ from typing import Dict, Any, Optional, Callable, Type, TypeVar, Union, Tuple
 
 # Absolute imports
 from uhf_rfid.protocols.base_protocol import (
-    BaseProtocol, DeviceInfo, TagReadData,
+    BaseProtocol, BytesLike, DeviceInfo, TagReadData,
     PARAM_TYPE_POWER, PARAM_TYPE_BUZZER, PARAM_TYPE_TAG_FILTER_TIME
 )
 from uhf_rfid.protocols import framing
@@ -216,7 +216,7 @@ class CPHProtocol(BaseProtocol):
     def decode_read_tag_memory_response(self, parsed_params: Dict[Any, Any]) -> bytes:
         return commands_tags.decode_read_tag_memory_response(parsed_params)
 
-    def encode_write_tag_memory_request(self, bank: int, word_ptr: int, data: bytes, password: Optional[bytes] = None) -> bytes:
+    def encode_write_tag_memory_request(self, bank: int, word_ptr: int, data: BytesLike, password: Optional[bytes] = None) -> bytes:
         return commands_tags.encode_write_tag_memory_request(bank, word_ptr, data, password)
 
     # --- Tag Locking ---
@@ -224,14 +224,14 @@ class CPHProtocol(BaseProtocol):
         return commands_tags.encode_lock_tag_request(lock_type, password)
 
     # --- Tag Kill ---
-    def encode_kill_tag_request(self, kill_password: bytes) -> bytes:
+    def encode_kill_tag_request(self, kill_password: BytesLike) -> bytes:
         return commands_tags.encode_kill_tag_request(kill_password)
 
     # --- Relay / Audio ---
     def encode_relay_op_request(self, relay_state: int) -> bytes:
         return commands_misc.encode_relay_op_request(relay_state)
 
-    def encode_audio_play_request(self, audio_data: bytes) -> bytes:
+    def encode_audio_play_request(self, audio_data: BytesLike) -> bytes:
         return commands_misc.encode_audio_play_request(audio_data)
 
     # --- Notifications ---
@@ -284,7 +284,4 @@ class CPHProtocol(BaseProtocol):
 
     def get_error_message(self, status_code: int) -> str:
         """ Returns CPH error message for a status code. """
-        return cph_const.CPH_STATUS_MESSAGES.get(status_code, f"Unknown CPH Status Code: 0x{status_code:02X}")
-
-    def __init__(self):
-        # existing initialization code
\ No newline at end of file
+        return cph_const.CPH_STATUS_MESSAGES.get(status_code, f"Unknown CPH Status Code: 0x{status_code:02X}")
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import logging
 import struct
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Sequence, Tuple, Optional
 
 from uhf_rfid.core.exceptions import TLVParseError
 # Import constants
@@ -47,11 +47,28 @@ def parse_tlv_sequence(data: bytes) -> Dict[int, Any]:
     """
     parsed_tlvs: Dict[int, Any] = {}
     offset = 0
-    while offset < len(data):
-        try:
-            tag, length, value, consumed = parse_tlv(data[offset:])
-        except TLVParseError as e:
-             raise TLVParseError(f"Failed parsing TLV sequence at offset {offset}: {e}", tlv_data=data[offset:]) from e
+    data_len = len(data)
+    while offset < data_len:
+        # Header parsed in place instead of via parse_tlv(data[offset:]):
+        # slicing the remainder per TLV copies O(n) bytes for every element,
+        # which matters when walking dense notification parameter runs.
+        if data_len - offset < 2:
+            raise TLVParseError(
+                f"Failed parsing TLV sequence at offset {offset}: Insufficient data for TLV header "
+                f"(need 2, got {data_len - offset})",
+                tlv_data=data[offset:]
+            )
+        tag = data[offset]
+        length = data[offset + 1]
+        value_start = offset + 2
+        value_end = value_start + length
+        if value_end > data_len:
+            raise TLVParseError(
+                f"Failed parsing TLV sequence at offset {offset}: Declared TLV length ({length}) "
+                f"exceeds available data ({data_len - value_start} bytes after header)",
+                tlv_data=data[offset:]
+            )
+        value = data[value_start:value_end]
 
         # --- Specific Parsing Logic based on Tag ---
         # parsed_value: Any # Remove initialization here
@@ -114,7 +131,7 @@ def parse_tlv_sequence(data: bytes) -> Dict[int, Any]:
 
         # Now assign the parsed value
         parsed_tlvs[tag] = parsed_value
-        offset += consumed
+        offset = value_end
 
     return parsed_tlvs
 
@@ -208,6 +225,16 @@ def _parse_operation_tlv_value(value_bytes: bytes, declared_length: int) -> Dict
     return parsed_op
 # --- Building Functions ---
 
+# Pre-bound header packer: skips the per-call format-string parse and the
+# module attribute lookups of struct.pack on the encode hot path.
+_pack_tlv_header = struct.Struct('>BB').pack
+
+# All 256 one-byte values, prebuilt so encoders with a range-checked int in
+# hand can index instead of calling the bytes constructor. Only safe after
+# validation: a negative index would silently wrap.
+_SINGLE_BYTES = tuple(bytes((i,)) for i in range(256))
+
+
 def build_tlv(tag: int, value: bytes) -> bytes:
     """Builds a simple TLV structure (1-byte Length field)."""
     length = len(value)
@@ -215,7 +242,30 @@ def build_tlv(tag: int, value: bytes) -> bytes:
         raise ValueError("TLV value length exceeds 255 bytes (1-byte length field).")
     if not (0 <= tag <= 255):
          raise ValueError("TLV tag must be between 0 and 255.")
-    return struct.pack('>BB', tag, length) + value
+    return _pack_tlv_header(tag, length) + value
+
+def build_tlvs(items: Sequence[Tuple[int, bytes]]) -> bytes:
+    """
+    Builds a concatenated run of TLVs ((tag, value) pairs) in one pre-sized
+    buffer. Equivalent to joining individual build_tlv() results, but without
+    allocating an intermediate bytes object per TLV.
+    """
+    total = 0
+    for _tag, value in items:
+        total += 2 + len(value)
+    out = bytearray(total)
+    offset = 0
+    for tag, value in items:
+        length = len(value)
+        if length > 255:
+            raise ValueError("TLV value length exceeds 255 bytes (1-byte length field).")
+        if not (0 <= tag <= 255):
+            raise ValueError("TLV tag must be between 0 and 255.")
+        out[offset] = tag
+        out[offset + 1] = length
+        out[offset + 2:offset + 2 + length] = value
+        offset += 2 + length
+    return bytes(out)
 
 def build_single_parameter_tlv(param_type: int, param_value_bytes: bytes) -> bytes:
     """Builds the TLV structure for TAG_SINGLE_PARAMETER."""
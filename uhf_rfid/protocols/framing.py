@@ -1,5 +1,6 @@
 # uhf_rfid/protocols/framing.py
 
+import logging
 import struct
 from typing import Tuple, Optional
 
@@ -8,6 +9,22 @@ from typing import Tuple, Optional
 from uhf_rfid.protocols.cph import constants as cph_const
 from uhf_rfid.core.exceptions import FrameParseError, ChecksumError
 
+logger = logging.getLogger(__name__)
+
+# Compiled once at import time; skips re-parsing the format string on every
+# frame build/parse. Layout: header (2s), frame type (B), address (H),
+# frame code (B), parameter length (H).
+_FRAME_HEADER_STRUCT = struct.Struct('>2sBHBH')
+
+# Module-level bindings of the hot cph_const lookups: a LOAD_GLOBAL beats a
+# module attribute lookup in the per-frame parse loop.
+_FRAME_HEADER = cph_const.FRAME_HEADER
+_MIN_FRAME_LENGTH = cph_const.MIN_FRAME_LENGTH
+_CHECKSUM_LENGTH = cph_const.CHECKSUM_LENGTH
+_HEADER_LENGTH = cph_const.HEADER_LENGTH
+# Fixed-field span from the 'RF' header through the parameter-length field.
+_HEADER_FIELDS_LENGTH = _FRAME_HEADER_STRUCT.size
+
 # --- Checksum Calculation (as defined in section 1.3) ---
 
 def calculate_checksum(data: bytes) -> int:
@@ -67,59 +84,63 @@ def build_frame(
     # > = Big-endian
     # B = Unsigned char (1 byte)
     # H = Unsigned short (2 bytes)
-    # Construct the frame *without* the checksum first
+    # Build directly into a pre-sized bytearray: one allocation per frame
+    # instead of a fresh bytes object per '+' concatenation.
     # --- Use constants from cph_const ---
-    frame_without_checksum = struct.pack(
-        '>2sBHBH',
-        cph_const.FRAME_HEADER, # Use imported constant
+    header_size = _MIN_FRAME_LENGTH - _CHECKSUM_LENGTH
+    buf = bytearray(_MIN_FRAME_LENGTH + param_len)
+    _FRAME_HEADER_STRUCT.pack_into(
+        buf, 0,
+        _FRAME_HEADER,
         frame_type,
         address,
         frame_code,
         param_len
-    ) + parameters
-
-    checksum = calculate_checksum(frame_without_checksum)
-    full_frame = frame_without_checksum + struct.pack('>B', checksum)
-    return full_frame
+    )
+    buf[header_size:header_size + param_len] = parameters
+    buf[-1] = calculate_checksum(memoryview(buf)[:-1])
+    return bytes(buf)
 
 # --- Frame Parsing (Basic) ---
-def parse_frame_header(data: bytes) -> Tuple[int, int, int, int, bytes, int, int]: # Added start_index to return tuple signature
+def parse_frame_header(data: bytes, start: int = 0) -> Tuple[int, int, int, int, memoryview, int, int]: # Added start_index to return tuple signature
+    # NOTE: 'parameters' in the returned tuple is a memoryview aliasing
+    # 'data'. Callers that keep it beyond the lifetime of 'data' must copy
+    # it with .tobytes().
     # --- Use constants from cph_const ---
-    if not data or len(data) < cph_const.MIN_FRAME_LENGTH: # Use imported constant
-        raise FrameParseError(f"Data length {len(data)} is less than minimum frame length {cph_const.MIN_FRAME_LENGTH}.", frame_part=data)
-
-    start_index = data.find(cph_const.FRAME_HEADER) # Use imported constant
+    if not data or len(data) < _MIN_FRAME_LENGTH:
+        raise FrameParseError(f"Data length {len(data)} is less than minimum frame length {_MIN_FRAME_LENGTH}.", frame_part=data)
+
+    # bytes.startswith(header, offset) compares in place without building a
+    # 2-byte slice; it short-circuits the common case where the frame is
+    # aligned at 'start'. bytes.find is the C-level scan for the junk-prefix
+    # case, with 'start' letting stream parsers resume past examined bytes.
+    if data.startswith(_FRAME_HEADER, start):
+        start_index = start
+    else:
+        start_index = data.find(_FRAME_HEADER, start)
     if start_index == -1:
-        raise FrameParseError(f"Frame header '{cph_const.FRAME_HEADER.decode()}' not found.", frame_part=data)
+        raise FrameParseError(f"Frame header '{_FRAME_HEADER.decode()}' not found.", frame_part=data)
 
-    if len(data) < start_index + cph_const.MIN_FRAME_LENGTH: # Use imported constant
+    if len(data) < start_index + _MIN_FRAME_LENGTH:
          raise FrameParseError(
              f"Insufficient data after header found at index {start_index}. "
-             f"Need {cph_const.MIN_FRAME_LENGTH} bytes, found {len(data) - start_index}.",
+             f"Need {_MIN_FRAME_LENGTH} bytes, found {len(data) - start_index}.",
              frame_part=data[start_index:]
          )
 
     frame_start_ptr = start_index
-    header_end_ptr = (
-        frame_start_ptr + cph_const.HEADER_LENGTH + cph_const.FRAME_TYPE_LENGTH +
-        cph_const.ADDRESS_LENGTH + cph_const.FRAME_CODE_LENGTH +
-        cph_const.PARAM_LENGTH_FIELD_LENGTH
-    ) # Use imported constants
+    header_end_ptr = frame_start_ptr + _HEADER_FIELDS_LENGTH
 
     try:
-        # --- Use constant for header length in unpack ---
-        _, frame_type, address, frame_code, declared_param_len = struct.unpack(
-            '>2sBHBH',
-            data[frame_start_ptr : header_end_ptr]
+        # --- Use compiled Struct; unpack_from avoids slicing the buffer ---
+        _, frame_type, address, frame_code, declared_param_len = _FRAME_HEADER_STRUCT.unpack_from(
+            data, frame_start_ptr
         )
     except struct.error as e:
         raise FrameParseError(f"Failed to unpack header fields: {e}", frame_part=data[frame_start_ptr:header_end_ptr]) from e
 
     # --- Use constants for lengths ---
-    expected_total_length = (
-        header_end_ptr - frame_start_ptr +
-        declared_param_len + cph_const.CHECKSUM_LENGTH
-    ) # Use imported constant
+    expected_total_length = _HEADER_FIELDS_LENGTH + declared_param_len + _CHECKSUM_LENGTH
 
     if len(data) < frame_start_ptr + expected_total_length:
         raise FrameParseError(
@@ -129,37 +150,74 @@ def parse_frame_header(data: bytes) -> Tuple[int, int, int, int, bytes, int, int
             frame_part=data[start_index:]
         )
 
-    full_frame_data = data[frame_start_ptr : frame_start_ptr + expected_total_length]
-    frame_content = full_frame_data[:-cph_const.CHECKSUM_LENGTH] # Use imported constant
-    received_checksum = full_frame_data[-cph_const.CHECKSUM_LENGTH] # Use imported constant
+    # Work on zero-copy views of the frame; the checksum and the returned
+    # parameters alias 'data' instead of slicing fresh bytes objects.
+    full_frame_view = memoryview(data)[frame_start_ptr : frame_start_ptr + expected_total_length]
+    frame_content = full_frame_view[:-_CHECKSUM_LENGTH]
+    received_checksum = full_frame_view[-_CHECKSUM_LENGTH]
 
     calculated_checksum = calculate_checksum(frame_content)
     if calculated_checksum != received_checksum:
-        raise ChecksumError(calculated_checksum, received_checksum, full_frame_data)
+        # The exception may outlive the caller's buffer, so give it a copy.
+        raise ChecksumError(calculated_checksum, received_checksum, bytes(full_frame_view))
 
-    param_start_ptr = header_end_ptr
-    param_end_ptr = param_start_ptr + declared_param_len
-    parameters = frame_content[param_start_ptr - frame_start_ptr : param_end_ptr - frame_start_ptr]
+    parameters = full_frame_view[_HEADER_FIELDS_LENGTH : _HEADER_FIELDS_LENGTH + declared_param_len]
 
     return frame_type, address, frame_code, declared_param_len, parameters, expected_total_length, start_index
 
-def find_and_parse_frame(buffer: bytearray) -> Optional[Tuple[int, int, int, bytes, int]]:
-    # --- Use constants from cph_const ---
-    if len(buffer) < cph_const.MIN_FRAME_LENGTH: # Use imported constant
-        return None
+def find_and_parse_frame_at(
+    buffer, offset: int = 0
+) -> Tuple[Optional[Tuple[int, int, int, bytes, int]], int]:
+    """
+    Offset-tracking variant of find_and_parse_frame for stream parsers.
+
+    Scans 'buffer' (bytes or bytearray) from 'offset' without mutating or
+    copying it, and returns (result, new_offset). 'result' is the usual
+    (frame_type, address, frame_code, parameters, frame_length) tuple or
+    None; 'new_offset' is where the next scan should resume (advanced past
+    a parsed frame, or past the 'RF' of a corrupt one). The caller owns
+    compaction of consumed bytes, so draining N queued frames costs O(N)
+    instead of re-copying the whole buffer per frame.
+    """
+    if len(buffer) - offset < _MIN_FRAME_LENGTH:
+        return None, offset
+
+    # Locate the header once; the index is reused both for parsing and for
+    # recovery, so a bad frame never triggers a second scan of the buffer.
+    start_index = buffer.find(_FRAME_HEADER, offset)
+    if start_index == -1:
+        # No header anywhere: keep the buffer (the tail may hold the first
+        # byte of a header split across reads).
+        return None, offset
 
     try:
-        frame_type, address, frame_code, _, parameters, consumed_length, start_index = parse_frame_header(bytes(buffer))
-        del buffer[:start_index + consumed_length]
-        return frame_type, address, frame_code, parameters, consumed_length
-    except (FrameParseError, ChecksumError) as e:
-        start_index = buffer.find(cph_const.FRAME_HEADER) # Use imported constant
-        if start_index != -1:
-            # Simplified recovery: discard up to end of found header 'RF'
-            print(f"Frame error encountered: {e}. Discarding {start_index + cph_const.HEADER_LENGTH} bytes from buffer start.") # Use constant
-            del buffer[:start_index + cph_const.HEADER_LENGTH] # Use constant
-        else:
-            print(f"Frame error encountered: {e}. No header found or error before header. Buffer unchanged.")
-        return None
+        frame_type, address, frame_code, _, parameters, consumed_length, start_index = parse_frame_header(buffer, start_index)
+        # 'parameters' is a zero-copy memoryview into 'buffer'. The caller
+        # must promote it with bytes() before compacting the buffer or
+        # letting it escape to consumers that may retain it.
+        return (frame_type, address, frame_code, parameters, consumed_length), start_index + consumed_length
+    except ChecksumError as e:
+        # Recovery: skip just past the 'RF' of the corrupt frame so the next
+        # scan resumes there. O(1) decision, no re-scan.
+        logger.warning(f"Frame error encountered: {e}. Skipping past header at offset {start_index}.")
+        return None, start_index + _HEADER_LENGTH
+    except FrameParseError:
+        # Frame is incomplete (or header fields unreadable yet): leave the
+        # offset untouched and wait for more data.
+        return None, offset
     except ValueError:
-        return None
\ No newline at end of file
+        return None, offset
+
+
+def find_and_parse_frame(buffer: bytearray) -> Optional[Tuple[int, int, int, bytes, int]]:
+    """Mutating convenience wrapper: consumes parsed/corrupt bytes in place."""
+    result, new_offset = find_and_parse_frame_at(buffer, 0)
+    if result is not None:
+        # Own the parameters before the source region is deleted below; the
+        # view must be released or the del would raise BufferError.
+        frame_type, address, frame_code, parameters, consumed_length = result
+        result = (frame_type, address, frame_code, bytes(parameters), consumed_length)
+        parameters.release()
+    if new_offset:
+        del buffer[:new_offset]
+    return result
\ No newline at end of file
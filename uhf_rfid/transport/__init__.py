@@ -1,15 +1,32 @@
 """Transport implementations for UHF RFID library."""
 
-from .base import BaseTransport
-from .serial_async import SerialTransport
-from .tcp_async import TcpTransport
-from .mock import MockTransport
-from .udp_async import UdpTransport
+import importlib
+
+# Loaded lazily (PEP 562): importing e.g. MockTransport must not pull in
+# pyserial (SerialTransport) or the other transport stacks.
+_LAZY = {
+    'BaseTransport': '.base',
+    'SerialTransport': '.serial_async',
+    'TcpTransport': '.tcp_async',
+    'MockTransport': '.mock',
+    'UdpTransport': '.udp_async',
+}
 
 __all__ = [
     'BaseTransport',
     'SerialTransport',
     'TcpTransport',
     'MockTransport',
-    'UdpTransport'
-] 
\ No newline at end of file
+    'UdpTransport',
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -10,11 +10,53 @@ from uhf_rfid.core.status import ConnectionStatus # Needed for status updates on
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_TCP_BUFFER_SIZE = 4096 # Bytes to read at a time
+# Cap the loop's outgoing buffer around one maximum CPH frame (64 KiB of
+# parameters plus header/checksum) so a bulk write_tag cannot queue
+# unbounded data before pause_writing kicks in.
+MAX_WRITE_BUFFER = 64 * 1024 + 16
+
+
+class _TcpClientProtocol(asyncio.Protocol):
+    """
+    Push-based bridge between the event loop and a TcpTransport.
+
+    The loop hands received chunks straight to data_received, so there is no
+    StreamReader in the middle: its internal buffer copy and the background
+    `await reader.read()` task both disappear. (A BufferedProtocol with a
+    reusable receive buffer is deliberately not used: the transport's data
+    callback is async and runs after data_received returns, so the chunk
+    must own its bytes anyway.)
+    """
+
+    def __init__(self, owner: 'TcpTransport'):
+        self._owner = owner
+        self._drain_event = asyncio.Event()
+        self._drain_event.set()
+        self.closed_event = asyncio.Event()
+
+    def data_received(self, data: bytes) -> None:
+        self._owner._on_data_received(data)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        # Unblock any sender stuck in drain(), then let the transport react.
+        self._drain_event.set()
+        self.closed_event.set()
+        self._owner._on_connection_lost(exc)
+
+    def pause_writing(self) -> None:
+        self._drain_event.clear()
+
+    def resume_writing(self) -> None:
+        self._drain_event.set()
+
+    async def drain(self) -> None:
+        """Waits until the loop's write buffer is below the low-water mark."""
+        await self._drain_event.wait()
+
 
 class TcpTransport(BaseTransport):
     """
-    Asynchronous TCP communication transport using asyncio streams.
+    Asynchronous TCP communication transport using a plain asyncio.Protocol.
     """
 
     def __init__(self, connection_details: Dict[str, Any]):
@@ -34,9 +76,13 @@ class TcpTransport(BaseTransport):
         self._host = str(self._connection_details['host'])
         self._port = int(self._connection_details['port'])
 
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
-        self._read_buffer_size = self._connection_details.get('buffer_size', DEFAULT_TCP_BUFFER_SIZE)
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[_TcpClientProtocol] = None
+        # Received chunks are queued here and drained by a single consumer
+        # task so dispatch happens strictly in arrival order (see
+        # _rx_consumer); both live only while connected.
+        self._rx_queue: Optional[asyncio.Queue] = None
+        self._rx_task: Optional[asyncio.Task] = None
 
         logger.info(f"TcpTransport initialized for {self._host}:{self._port}")
 
@@ -57,83 +103,92 @@ class TcpTransport(BaseTransport):
 
             logger.info(f"Connecting to TCP endpoint {self.host}:{self.port}...")
             try:
-                # Use asyncio's stream API to open the connection
-                self._reader, self._writer = await asyncio.open_connection(
-                    host=self.host, port=self.port
+                loop = asyncio.get_running_loop()
+                self._transport, self._protocol = await loop.create_connection(
+                    lambda: _TcpClientProtocol(self), host=self.host, port=self.port
                 )
+                self._transport.set_write_buffer_limits(high=MAX_WRITE_BUFFER)
+                self._rx_queue = asyncio.Queue()
+                self._rx_task = loop.create_task(self._rx_consumer())
                 self._connected = True
-                peername = self._writer.get_extra_info('peername', ('Unknown', 'Unknown'))
+                peername = self._transport.get_extra_info('peername', ('Unknown', 'Unknown'))
                 logger.info(f"TCP connection to {self.host}:{self.port} established (peer: {peername}).")
 
-                # Start the background reader task
-                await self._start_reader()
-
             except ConnectionRefusedError as e:
                 logger.error(f"Connection refused when connecting to {self.host}:{self.port}: {e}")
                 self._connected = False
-                self._reader = None
-                self._writer = None
+                self._transport = None
+                self._protocol = None
                 raise NetworkConnectionError(host=self.host, port=self.port, message="Connection refused.", original_exception=e) from e
             except asyncio.TimeoutError as e:
                  logger.error(f"Timeout during TCP connection attempt to {self.host}:{self.port}: {e}")
                  self._connected = False
-                 self._reader = None
-                 self._writer = None
+                 self._transport = None
+                 self._protocol = None
                  raise NetworkConnectionError(host=self.host, port=self.port, message="Connection attempt timed out.", original_exception=e) from e
             except OSError as e: # Catches host unreachable, network errors etc.
                 logger.error(f"OS error connecting to {self.host}:{self.port}: {e}")
                 self._connected = False
-                self._reader = None
-                self._writer = None
+                self._transport = None
+                self._protocol = None
                 raise NetworkConnectionError(host=self.host, port=self.port, message=f"OS error: {e}", original_exception=e) from e
             except Exception as e: # Catch other unexpected errors
                  logger.exception(f"Unexpected error connecting to {self.host}:{self.port}: {e}")
                  self._connected = False
-                 self._reader = None
-                 self._writer = None
+                 self._transport = None
+                 self._protocol = None
                  raise ConnectionError(f"Unexpected error connecting to {self.host}:{self.port}: {e}", original_exception=e) from e
 
 
     async def disconnect(self) -> None:
         """Closes the asynchronous TCP connection."""
         async with self._connection_lock:
-            if not self._connected and not (self._reader_task and not self._reader_task.done()):
+            if not self._connected and self._transport is None:
                 # logger.debug(f"TCP connection to {self.host}:{self.port} already disconnected.")
                 return
 
             logger.info(f"Disconnecting from TCP endpoint {self.host}:{self.port}...")
 
-            # Stop the reader task first
-            await self._stop_reader()
-
-            writer = self._writer # Local reference
-            if writer:
-                self._writer = None # Clear instance variable early
-                self._reader = None
-                if not writer.is_closing():
+            self._connected = False # Mark early so connection_lost doesn't re-enter
+            transport = self._transport
+            protocol = self._protocol
+            rx_task = self._rx_task
+            self._transport = None
+            self._protocol = None
+            self._rx_task = None
+            self._rx_queue = None
+            if rx_task is not None and not rx_task.done():
+                rx_task.cancel()
+                try:
+                    await rx_task
+                except asyncio.CancelledError:
+                    pass
+            if transport is not None:
+                if not transport.is_closing():
                     try:
-                        writer.close()
-                        await writer.wait_closed()
-                        logger.debug(f"TCP writer for {self.host}:{self.port} closed.")
+                        transport.close()
                     except Exception as e:
-                        logger.error(f"Error closing TCP writer for {self.host}:{self.port}: {e}")
+                        logger.error(f"Error closing TCP transport for {self.host}:{self.port}: {e}")
                         # Continue disconnect anyway
+                if protocol is not None:
+                    # connection_lost sets this once the socket is really gone
+                    await protocol.closed_event.wait()
+                logger.debug(f"TCP transport for {self.host}:{self.port} closed.")
 
-            self._connected = False # Mark as disconnected
             logger.info(f"TCP connection to {self.host}:{self.port} disconnected.")
 
 
     async def send(self, data: bytes) -> None:
         """Sends data over the TCP connection asynchronously."""
-        if not self.is_connected() or not self._writer:
-            raise TransportError(f"Cannot send data: TCP connection to {self.host}:{self.port} not established or writer is invalid.")
+        if not self.is_connected() or not self._transport:
+            raise TransportError(f"Cannot send data: TCP connection to {self.host}:{self.port} not established or transport is invalid.")
 
-        peername = self._writer.get_extra_info('peername', 'Unknown')
-        logger.debug(f"TCP sending ({len(data)} bytes) to {peername}: {data.hex(' ').upper()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            peername = self._transport.get_extra_info('peername', 'Unknown')
+            logger.debug(f"TCP sending ({len(data)} bytes) to {peername}: {data.hex(' ').upper()}")
         try:
-            self._writer.write(data)
-            await self._writer.drain() # Wait until the OS buffer accepts all data
-            logger.debug(f"TCP send to {peername} complete.")
+            self._transport.write(data)
+            await self._protocol.drain() # Wait until the write buffer drains below the limit
         except (ConnectionResetError, BrokenPipeError) as e:
              logger.error(f"Connection error while writing to {self.host}:{self.port}: {e}")
              # Connection is likely broken, trigger disconnect
@@ -153,52 +208,55 @@ class TcpTransport(BaseTransport):
 
 
     async def _read_data_loop(self) -> None:
-        """Background task to continuously read data from the TCP connection."""
-        peername = self._writer.get_extra_info('peername', 'Unknown') if self._writer else 'Unknown'
-        logger.info(f"TCP reader loop started for {peername}.")
+        """Unused: the event loop pushes data via _TcpClientProtocol instead."""
+        return
+
+    # --- Protocol hooks ---
+
+    def _on_data_received(self, data: bytes) -> None:
+        """Called by _TcpClientProtocol for every chunk the loop delivers."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"TCP received ({len(data)} bytes) from {self.host}:{self.port}: {data.hex(' ').upper()}")
+        if self._rx_queue is not None:
+            self._rx_queue.put_nowait(data)
+        else:
+            logger.warning(f"TCP data received from {self.host}:{self.port} but transport is not accepting data.")
+
+    async def _rx_consumer(self) -> None:
+        """Drains queued chunks to the data callback one at a time.
+
+        A single consumer awaiting each dispatch to completion keeps chunk
+        delivery in arrival order even when the callback chain suspends —
+        one task per chunk would interleave at every await, breaking the
+        dispatcher's FIFO response pairing and letting notification
+        callbacks run concurrently. This mirrors the serial transport's
+        inline read loop, which awaits the callback before reading more.
+        """
+        queue = self._rx_queue
+        while True:
+            data = await queue.get()
+            await self._dispatch_data(data)
+
+    async def _dispatch_data(self, data: bytes) -> None:
+        callback = self._data_received_callback
+        if callback is None:
+            logger.warning(f"TCP data received from {self.host}:{self.port} but no callback registered.")
+            return
         try:
-            while self._connected and self._reader:
-                # Read data from the stream
-                data = await self._reader.read(self._read_buffer_size)
-
-                if data:
-                    logger.debug(f"TCP received ({len(data)} bytes) from {peername}: {data.hex(' ').upper()}")
-                    if self._data_received_callback:
-                        try:
-                            await self._data_received_callback(data)
-                        except Exception as e:
-                             logger.exception(f"Error in TCP data received callback: {e}")
-                    else:
-                        logger.warning(f"TCP data received from {peername} but no callback registered.")
-                else:
-                    # read() returning empty bytes means EOF - connection closed by peer
-                    logger.warning(f"TCP connection closed by peer {peername}.")
-                    if self._connected: # Avoid duplicate disconnect calls
-                         asyncio.create_task(self._handle_remote_disconnect())
-                    break # Exit loop
-
-        except asyncio.CancelledError:
-            logger.info(f"TCP reader loop for {peername} cancelled.")
-            raise
-        except asyncio.IncompleteReadError as e:
-             logger.error(f"Incomplete read from {peername}: {e}")
-             if self._connected:
-                  asyncio.create_task(self._handle_read_error(e))
-        except (ConnectionResetError, BrokenPipeError) as e:
-             logger.error(f"Connection error while reading from {peername}: {e}")
-             if self._connected:
-                  asyncio.create_task(self._handle_read_error(e))
-        except OSError as e: # Other socket errors
-             logger.error(f"OS error while reading from {peername}: {e}")
-             if self._connected:
-                  asyncio.create_task(self._handle_read_error(e))
+            await callback(data)
         except Exception as e:
-             logger.exception(f"Unexpected error in TCP reader loop for {peername}: {e}")
-             if self._connected:
-                  asyncio.create_task(self._handle_read_error(e))
-        finally:
-             logger.info(f"TCP reader loop for {peername} stopped.")
-
+            logger.exception(f"Error in TCP data received callback: {e}")
+
+    def _on_connection_lost(self, exc: Optional[Exception]) -> None:
+        """Called by _TcpClientProtocol when the socket closes."""
+        if not self._connected:
+            return # Local disconnect already in progress
+        if exc is None:
+            logger.warning(f"TCP connection closed by peer {self.host}:{self.port}.")
+            asyncio.create_task(self._handle_remote_disconnect())
+        else:
+            logger.error(f"Connection error while reading from {self.host}:{self.port}: {exc}")
+            asyncio.create_task(self._handle_read_error(exc))
 
     # --- Error Handling Helpers (similar to SerialTransport) ---
 
@@ -2,7 +2,8 @@
 import logging
 import json
 import os
-from typing import Dict, Any, TYPE_CHECKING, Optional, cast
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, TYPE_CHECKING, Optional, cast
 
 # Use absolute imports if Reader is needed type checking
 if TYPE_CHECKING:
@@ -18,38 +19,82 @@ from uhf_rfid.core.exceptions import RFIDError
 logger = logging.getLogger(__name__)
 
 # --- Tag Definitions Cache ---
-_tag_definitions: Optional[Dict[str, Any]] = None
+# The cached definitions are frozen (MappingProxyType, recursively) so that
+# concurrent identify_tag() tasks can share them without locks or copies.
+_tag_definitions: Optional[Mapping[str, Any]] = None
 _definitions_filepath: str = os.path.join(
     os.path.dirname(__file__), 'tag_definitions.json'
 )
 
+_EMPTY_DEFINITIONS: Mapping[str, Any] = MappingProxyType({"manufacturers": MappingProxyType({})})
 
-def load_tag_definitions(filepath: str = _definitions_filepath) -> Dict[str, Any]:
-    """Loads tag definitions from the specified JSON file and caches them."""
+
+def _freeze(obj: Any) -> Any:
+    """Recursively wraps dicts in read-only MappingProxyType views."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    return obj
+
+
+def _normalize_definitions(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts manufacturer/model ID keys from JSON strings to ints.
+
+    Done once at load time so per-tag lookups are plain int hash lookups
+    with no str() conversion in the identification hot path.
+    """
+    manufacturers: Dict[int, Any] = {}
+    for mdid, info in raw.get("manufacturers", {}).items():
+        entry = dict(info)
+        entry["models"] = {int(tmn): model for tmn, model in info.get("models", {}).items()}
+        manufacturers[int(mdid)] = entry
+    normalized = dict(raw)
+    normalized["manufacturers"] = manufacturers
+    return normalized
+
+
+def set_definitions(definitions: Dict[str, Any]) -> None:
+    """Injects tag definitions directly, bypassing the JSON file.
+
+    The definitions are frozen exactly like file-loaded ones. Intended for
+    tests and for embedders that already hold the definitions in memory.
+    Pass None-clearing is done by assigning _tag_definitions = None.
+    """
+    global _tag_definitions
+    _tag_definitions = _freeze(_normalize_definitions(definitions))
+
+
+def load_tag_definitions(filepath: str = _definitions_filepath) -> Mapping[str, Any]:
+    """Loads tag definitions from the specified JSON file and caches them.
+
+    The returned mapping is immutable; callers needing a mutable copy must
+    copy it themselves.
+    """
     global _tag_definitions
     if _tag_definitions is not None:
         return _tag_definitions
 
     try:
         with open(filepath, 'r') as f:
-            _tag_definitions = json.load(f)
+            raw_definitions = json.load(f)
             logger.info(f"Successfully loaded tag definitions from {filepath}")
             # Perform basic validation if needed
-            if not isinstance(_tag_definitions, dict) or 'manufacturers' not in _tag_definitions:
+            if not isinstance(raw_definitions, dict) or 'manufacturers' not in raw_definitions:
                 logger.error("Tag definitions JSON is missing 'manufacturers' key.")
-                _tag_definitions = {"manufacturers": {}} # Return empty structure
+                _tag_definitions = _EMPTY_DEFINITIONS # Return empty structure
+            else:
+                _tag_definitions = _freeze(_normalize_definitions(raw_definitions))
             return _tag_definitions
     except FileNotFoundError:
         logger.warning(f"Tag definitions file not found at {filepath}. Returning empty definitions.")
-        _tag_definitions = {"manufacturers": {}}
+        _tag_definitions = _EMPTY_DEFINITIONS
         return _tag_definitions
     except json.JSONDecodeError as e:
         logger.error(f"Error decoding tag definitions JSON from {filepath}: {e}")
-        _tag_definitions = {"manufacturers": {}}
+        _tag_definitions = _EMPTY_DEFINITIONS
         return _tag_definitions
     except Exception as e:
         logger.exception(f"Unexpected error loading tag definitions from {filepath}: {e}")
-        _tag_definitions = {"manufacturers": {}}
+        _tag_definitions = _EMPTY_DEFINITIONS
         return _tag_definitions
 
 
@@ -99,7 +144,8 @@ async def identify_tag(reader: 'Reader', epc: str) -> Dict[str, Any]:
             word_ptr=0,
             word_count=2 # Read enough for ACI, MDID, TMN
         )
-        result["tid_raw"] = tid_data.hex()
+        # Single C-level hex pass; slice the string later for display needs.
+        result["tid_raw"] = bytes(tid_data).hex()
         logger.debug(f"Successfully read TID for EPC {epc}: {result['tid_raw']}")
 
         # --- Parse TID Data ---
@@ -115,24 +161,23 @@ async def identify_tag(reader: 'Reader', epc: str) -> Dict[str, Any]:
             result["manufacturer_id"] = manufacturer_id
             result["tag_model_number"] = tag_model_number
 
-            # --- Look up in Definitions ---
-            mdid_str = str(manufacturer_id)
-            tmn_str = str(tag_model_number)
-
-            manufacturer_info = manufacturers_data.get(mdid_str)
+            # --- Look up in Definitions (int keys, normalized at load) ---
+            manufacturer_info = manufacturers_data.get(manufacturer_id)
             if manufacturer_info:
-                tag_model_info = manufacturer_info.get("models", {}).get(tmn_str)
+                tag_model_info = manufacturer_info.get("models", {}).get(tag_model_number)
                 if tag_model_info:
-                    # Add manufacturer name to the model info for convenience
-                    tag_model_info['manufacturer_name'] = manufacturer_info.get('name', 'Unknown')
-                    result["tag_info"] = tag_model_info
-                    logger.info(f"Found definition for {epc} (MDID:{mdid_str}, TMN:{tmn_str}): {tag_model_info.get('model_name')}")
+                    # Copy before adding the manufacturer name for convenience;
+                    # the cached definitions themselves are read-only.
+                    tag_info = dict(tag_model_info)
+                    tag_info['manufacturer_name'] = manufacturer_info.get('name', 'Unknown')
+                    result["tag_info"] = tag_info
+                    logger.info(f"Found definition for {epc} (MDID:{manufacturer_id}, TMN:{tag_model_number}): {tag_model_info.get('model_name')}")
                 else:
-                    logger.warning(f"Definition not found for {epc} with MDID {mdid_str} and TMN {tmn_str}.")
+                    logger.warning(f"Definition not found for {epc} with MDID {manufacturer_id} and TMN {tag_model_number}.")
                     # Store manufacturer name if known, even if model is not
-                    result["tag_info"] = {"manufacturer_name": manufacturer_info.get('name')} 
+                    result["tag_info"] = {"manufacturer_name": manufacturer_info.get('name')}
             else:
-                logger.warning(f"Manufacturer definition not found for {epc} with MDID {mdid_str}.")
+                logger.warning(f"Manufacturer definition not found for {epc} with MDID {manufacturer_id}.")
 
         else:
             # This is a parsing issue based on TID content
@@ -148,9 +193,8 @@ async def identify_tag(reader: 'Reader', epc: str) -> Dict[str, Any]:
         # Errors during parsing (e.g., length check)
         logger.warning(f"Error parsing TID data for EPC {epc}: {e}")
         result["error"] = f"Error parsing TID data: {e}"
-        # Keep raw TID if it was successfully read but parsing failed
-        if tid_data is not None:
-            result["tid_raw"] = tid_data.hex() # Ensure raw data is stored if read was ok
+        # result["tid_raw"] was already hex-encoded right after the read;
+        # no need to re-encode here.
     except Exception as e:
         # Catch any other unexpected errors
         logger.exception(f"Unexpected error identifying tag {epc}: {e}")